@@ -1,21 +1,35 @@
 import asyncio
-from datetime import datetime
+import importlib
+import os
 from pathlib import Path
-from typing import Optional
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any, Optional
 import typer
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 
-from src.core.config import settings
-from src.core.models import ScheduleInfo, ScheduleMode, PostStatus
-from src.services.blog_service import BlogService
+if TYPE_CHECKING:
+    from src.core.models import ScheduleInfo
 
 app = typer.Typer(help="WordPress 자동 블로그 포스팅 시스템")
 console = Console()
 
 
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    """명령 코루틴 실행 (종료 시 공유 HTTP/OpenAI 클라이언트 정리)"""
+    async def main() -> None:
+        try:
+            await coro
+        finally:
+            from src.core.http import close_shared_client
+            from src.core.openai_client import close_openai_clients
+            await close_shared_client()
+            await close_openai_clients()
+
+    asyncio.run(main())
+
+
 @app.command("create")
 def create_post(
     topic: str = typer.Argument(..., help="블로그 포스트 주제"),
@@ -26,7 +40,7 @@ def create_post(
     publish: bool = typer.Option(False, "--publish", "-p", help="즉시 발행"),
 ):
     """새 블로그 포스트 생성"""
-    asyncio.run(_create_post_async(topic, schedule, categories, tags, draft, publish))
+    _run(_create_post_async(topic, schedule, categories, tags, draft, publish))
 
 
 async def _create_post_async(
@@ -38,6 +52,9 @@ async def _create_post_async(
     publish: bool
 ):
     """비동기 포스트 생성"""
+    # 무거운 모듈 import를 인자 파싱/진행 표시와 병행하여 미리 로드
+    warmup = asyncio.create_task(asyncio.to_thread(_prewarm_imports))
+    
     console.print(f"[bold blue]주제:[/bold blue] {topic}")
     
     # 스케줄 정보 파싱
@@ -47,6 +64,8 @@ async def _create_post_async(
     category_list = categories.split(',') if categories else None
     tag_list = tags.split(',') if tags else None
     
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -56,15 +75,17 @@ async def _create_post_async(
         task = progress.add_task("포스트 생성 중...", total=None)
         
         try:
-            blog_service = BlogService()
-            
-            progress.update(task, description="콘텐츠 생성 중...")
-            result = await blog_service.create_and_publish_post(
-                topic=topic,
-                schedule_info=schedule_info,
-                categories=category_list,
-                tags=tag_list
-            )
+            await warmup
+            from src.services.blog_service import BlogService
+
+            async with BlogService() as blog_service:
+                progress.update(task, description="콘텐츠 생성 중...")
+                result = await blog_service.create_and_publish_post(
+                    topic=topic,
+                    schedule_info=schedule_info,
+                    categories=category_list,
+                    tags=tag_list
+                )
             
             progress.update(task, description="완료!")
             
@@ -75,74 +96,99 @@ async def _create_post_async(
             console.print(f"[red]오류 발생:[/red] {e}")
 
 
+_PREWARM_MODULES = ("openai", "httpx", "PIL.Image", "src.services.blog_service")
+
+
+def _prewarm_imports() -> None:
+    """포스트 생성에 필요한 모듈 미리 로드 (워커 스레드에서 실행)"""
+    for module_name in _PREWARM_MODULES:
+        importlib.import_module(module_name)
+
+
 def _parse_schedule_info(
     schedule: Optional[str],
     draft: bool,
     publish: bool
-) -> ScheduleInfo:
+) -> "ScheduleInfo":
     """스케줄 정보 파싱"""
-    if draft:
-        return ScheduleInfo(mode=ScheduleMode.DRAFT)
-    elif publish:
-        return ScheduleInfo(mode=ScheduleMode.PUBLISH)
-    elif schedule:
-        try:
-            dt = datetime.strptime(schedule, "%Y-%m-%d %H:%M")
-            return ScheduleInfo(mode=ScheduleMode.SCHEDULE, datetime=dt)
-        except ValueError:
-            console.print("[red]잘못된 날짜 형식입니다. YYYY-MM-DD HH:MM 형식을 사용하세요.[/red]")
-            raise typer.Exit(1)
-    else:
-        return ScheduleInfo(mode=ScheduleMode.DRAFT)
+    from src.core.models import ScheduleInfo
+
+    try:
+        return ScheduleInfo.from_cli(schedule, draft, publish)
+    except ValueError:
+        console.print("[red]잘못된 날짜 형식입니다. YYYY-MM-DD HH:MM 형식을 사용하세요.[/red]")
+        raise typer.Exit(1)
+
+
+_CREATION_RESULT_TEMPLATE = """[green]✅ 포스트 생성 완료![/green]
+
+[bold]WordPress ID:[/bold] {wp_post_id}
+[bold]제목:[/bold] {title}
+[bold]상태:[/bold] {status}
+[bold]URL:[/bold] {url}
+[bold]품질 점수:[/bold] {quality_score}/100
+        """
+
+_POST_TABLE_COLUMNS = (
+    ("ID", "cyan"),
+    ("제목", "white"),
+    ("상태", "green"),
+    ("생성일", "blue"),
+    ("품질점수", "magenta"),
+)
 
 
 def _display_creation_result(result: dict):
     """생성 결과 출력"""
+    fields = ("wp_post_id", "title", "status", "url", "quality_score")
     panel = Panel.fit(
-        f"""[green]✅ 포스트 생성 완료![/green]
-
-[bold]WordPress ID:[/bold] {result.get('wp_post_id', 'N/A')}
-[bold]제목:[/bold] {result.get('title', 'N/A')}
-[bold]상태:[/bold] {result.get('status', 'N/A')}
-[bold]URL:[/bold] {result.get('url', 'N/A')}
-[bold]품질 점수:[/bold] {result.get('quality_score', 'N/A')}/100
-        """,
+        _CREATION_RESULT_TEMPLATE.format(**{key: result.get(key, "N/A") for key in fields}),
         title="생성 결과",
         border_style="green"
     )
     console.print(panel)
 
 
+def _build_posts_table() -> Table:
+    """포스트 목록 테이블 골격 생성"""
+    table = Table(title="최근 포스트")
+    for name, style in _POST_TABLE_COLUMNS:
+        table.add_column(name, style=style)
+    return table
+
+
+def _truncate_title(title: str, max_length: int = 50) -> str:
+    """긴 제목 말줄임 처리"""
+    return title[:max_length] + "..." if len(title) > max_length else title
+
+
 @app.command("list")
 def list_posts(
     limit: int = typer.Option(10, "--limit", "-l", help="표시할 포스트 수"),
     status: Optional[str] = typer.Option(None, "--status", "-s", help="필터링할 상태")
 ):
     """포스트 목록 조회"""
-    asyncio.run(_list_posts_async(limit, status))
+    _run(_list_posts_async(limit, status))
 
 
 async def _list_posts_async(limit: int, status: Optional[str]):
     """비동기 포스트 목록 조회"""
     try:
-        blog_service = BlogService()
-        posts = await blog_service.get_recent_posts(limit=limit, status=status)
+        from src.services.blog_service import BlogService
+
+        async with BlogService() as blog_service:
+            posts = await blog_service.get_recent_posts(limit=limit, status=status)
         
         if not posts:
             console.print("[yellow]포스트가 없습니다.[/yellow]")
             return
         
-        table = Table(title="최근 포스트")
-        table.add_column("ID", style="cyan")
-        table.add_column("제목", style="white")
-        table.add_column("상태", style="green")
-        table.add_column("생성일", style="blue")
-        table.add_column("품질점수", style="magenta")
+        table = _build_posts_table()
         
         for post in posts:
             table.add_row(
                 str(post.get('id', 'N/A')),
-                post.get('title', 'N/A')[:50] + "..." if len(post.get('title', '')) > 50 else post.get('title', 'N/A'),
+                _truncate_title(post.get('title') or 'N/A'),
                 post.get('status', 'N/A'),
                 post.get('created_at', 'N/A'),
                 f"{post.get('quality_score', 'N/A')}/100"
@@ -159,11 +205,13 @@ def preview_post(
     topic: str = typer.Argument(..., help="미리보기할 주제")
 ):
     """포스트 미리보기 생성"""
-    asyncio.run(_preview_post_async(topic))
+    _run(_preview_post_async(topic))
 
 
 async def _preview_post_async(topic: str):
     """비동기 포스트 미리보기"""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -173,10 +221,11 @@ async def _preview_post_async(topic: str):
         task = progress.add_task("미리보기 생성 중...", total=None)
         
         try:
-            blog_service = BlogService()
-            
-            progress.update(task, description="콘텐츠 생성 중...")
-            content = await blog_service.generate_content_only(topic)
+            from src.services.blog_service import BlogService
+
+            async with BlogService() as blog_service:
+                progress.update(task, description="콘텐츠 생성 중...")
+                content = await blog_service.generate_content_only(topic)
             
             progress.update(task, description="완료!")
             
@@ -205,6 +254,9 @@ async def _preview_post_async(topic: str):
 @app.command("config")
 def show_config():
     """현재 설정 표시"""
+    from src.core.config import get_settings
+
+    settings = get_settings()
     console.print(Panel.fit(
         f"""[bold]WordPress 설정[/bold]
 URL: {settings.wordpress_url}
@@ -228,6 +280,9 @@ URL: {settings.wordpress_url}
     ))
 
 
+_SETUP_DIRECTORIES = ("data", "logs", "images", "runs")
+
+
 @app.command("setup")
 def setup():
     """초기 설정"""
@@ -246,9 +301,8 @@ def setup():
             console.print("[green].env 파일이 생성되었습니다. 설정을 편집하세요.[/green]")
     
     # 필요한 디렉토리 생성
-    directories = ["data", "logs", "images", "runs"]
-    for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
+    for directory in _SETUP_DIRECTORIES:
+        os.makedirs(directory, exist_ok=True)
     
     console.print("[green]초기 설정이 완료되었습니다![/green]")
 
@@ -1,3 +1,5 @@
+from functools import cached_property, lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -20,6 +22,10 @@ class Settings(BaseSettings):
     # OpenAI API 설정
     openai_api_key: str = Field(..., description="OpenAI API 키")
     openai_model: str = Field(default="gpt-4", description="사용할 OpenAI 모델")
+    openai_concurrency: int = Field(default=4, description="OpenAI 동시 요청 수")
+    openai_json_mode: bool | None = Field(
+        default=None, description="JSON 모드 단일 요청 사용 여부 (미설정 시 모델명으로 판단)"
+    )
     
     # 이미지 생성 설정
     image_generator: str = Field(default="openai", description="이미지 생성기")
@@ -48,15 +54,25 @@ class Settings(BaseSettings):
     scheduler_timezone: str = Field(default="Asia/Seoul", description="스케줄러 타임존")
     post_schedule_hours: str = Field(default="09,14,19", description="게시 시간대")
     
-    @property
+    @cached_property
     def schedule_hours_list(self) -> list[int]:
         """스케줄 시간을 리스트로 반환"""
         return [int(hour.strip()) for hour in self.post_schedule_hours.split(",")]
     
-    @property
+    @cached_property
     def default_tags_list(self) -> list[str]:
         """기본 태그를 리스트로 반환"""
         return [tag.strip() for tag in self.default_tags.split(",")]
 
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """설정 인스턴스 반환 (최초 호출 시 .env 로드)"""
+    return Settings()
+
+
+def __getattr__(name: str):
+    """`from src.core.config import settings` 호환용 지연 접근"""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
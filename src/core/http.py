@@ -0,0 +1,31 @@
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import httpx
+
+_shared_client: Optional["httpx.AsyncClient"] = None
+
+
+def get_shared_client() -> "httpx.AsyncClient":
+    """앱 전역 공유 HTTP 클라이언트 반환 (지연 생성, h2 설치 시 HTTP/2)"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        import httpx
+
+        _shared_client = httpx.AsyncClient(
+            http2=find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=100, max_keepalive_connections=50, keepalive_expiry=30
+            ),
+            timeout=30
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """공유 HTTP 클라이언트 종료"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
\ No newline at end of file
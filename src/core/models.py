@@ -1,7 +1,11 @@
+import re
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# CLI 예약 시간 형식 (YYYY-MM-DD HH:MM)
+_SCHEDULE_RE = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}$")
 
 
 class PostStatus(str, Enum):
@@ -21,6 +25,8 @@ class ScheduleMode(str, Enum):
 
 class ImageInfo(BaseModel):
     """이미지 정보"""
+    model_config = ConfigDict(defer_build=True)
+
     path: str = Field(..., description="이미지 경로")
     alt: str = Field(..., description="이미지 ALT 텍스트")
     use_as_featured: bool = Field(default=False, description="대표 이미지로 사용")
@@ -32,9 +38,27 @@ class ScheduleInfo(BaseModel):
     mode: ScheduleMode = Field(..., description="스케줄 모드")
     scheduled_at: datetime | None = Field(default=None, description="예약 일시")  # ← 이름 변경
 
+    @classmethod
+    def from_cli(cls, schedule: Optional[str], draft: bool, publish: bool) -> "ScheduleInfo":
+        """CLI 옵션으로부터 스케줄 정보 생성 (잘못된 날짜 형식은 ValueError)"""
+        if draft:
+            return cls(mode=ScheduleMode.DRAFT)
+        if publish:
+            return cls(mode=ScheduleMode.PUBLISH)
+        if schedule:
+            if not _SCHEDULE_RE.match(schedule):
+                raise ValueError(f"잘못된 날짜 형식입니다: {schedule}")
+            return cls(
+                mode=ScheduleMode.SCHEDULE,
+                scheduled_at=datetime.fromisoformat(schedule.replace(" ", "T"))
+            )
+        return cls(mode=ScheduleMode.DRAFT)
+
 
 class PostContent(BaseModel):
     """포스트 콘텐츠"""
+    model_config = ConfigDict(defer_build=True)
+
     topic: str = Field(..., description="주제")
     outline: list[str] = Field(..., description="개요")
     content_html: str = Field(..., description="HTML 콘텐츠")
@@ -46,8 +70,20 @@ class PostContent(BaseModel):
     schedule: ScheduleInfo = Field(..., description="스케줄 정보")
 
 
+class PostDraft(BaseModel):
+    """단일 요청으로 생성된 포스트 초안"""
+    outline: list[str] = Field(..., description="개요")
+    content_html: str = Field(..., description="HTML 콘텐츠")
+    title: str = Field(..., description="SEO 제목")
+    excerpt: str = Field(..., description="요약")
+    slug: str = Field(..., description="슬러그")
+    keywords: str = Field(..., description="키워드 (쉼표로 구분)")
+
+
 class WordPressPost(BaseModel):
     """WordPress 포스트"""
+    model_config = ConfigDict(defer_build=True)
+
     id: Optional[int] = Field(default=None, description="포스트 ID")
     title: str = Field(..., description="제목")
     content: str = Field(..., description="내용")
@@ -94,6 +130,8 @@ class QualityCheckResult(BaseModel):
 
 class GenerationJob(BaseModel):
     """생성 작업"""
+    model_config = ConfigDict(defer_build=True)
+
     id: str = Field(..., description="작업 ID")
     topic: str = Field(..., description="주제")
     status: str = Field(..., description="상태")
@@ -0,0 +1,137 @@
+import asyncio
+from typing import TYPE_CHECKING, Optional
+from weakref import WeakKeyDictionary
+
+from src.core.config import get_settings
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+
+# API 키별 공유 클라이언트/배처 (close_openai_clients로 이벤트 루프 종료 전에 정리)
+_clients: dict[str, "AsyncOpenAI"] = {}
+_batchers: dict[str, "OpenAIBatcher"] = {}
+
+
+def get_async_client(api_key: str) -> "AsyncOpenAI":
+    """API 키별 AsyncOpenAI 클라이언트 반환 (커넥션 풀 재사용)"""
+    client = _clients.get(api_key)
+    if client is None:
+        from openai import AsyncOpenAI
+
+        client = _clients[api_key] = AsyncOpenAI(api_key=api_key)
+    return client
+
+
+# 이벤트 루프별 세마포어 (asyncio.run이 여러 번 호출되어도 다른 루프에 바인딩되지 않도록)
+_semaphores: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    WeakKeyDictionary()
+)
+
+
+def get_openai_semaphore() -> asyncio.Semaphore:
+    """현재 이벤트 루프의 OpenAI 동시 요청 수 제한용 세마포어 반환"""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(get_settings().openai_concurrency)
+    return semaphore
+
+
+class OpenAIBatcher:
+    """OpenAI 채팅 요청 마이크로 배치 (같은 시점에 모인 요청을 한 번에 디스패치)"""
+
+    def __init__(self, client: "AsyncOpenAI", window: float = 0.0, max_batch: int = 16):
+        self.client = client
+        self.window = window
+        self.max_batch = max_batch
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._batches: set[asyncio.Task] = set()
+
+    async def submit(self, **request) -> str:
+        """chat.completions.create 요청을 배치 큐에 넣고 응답 텍스트 반환"""
+        loop = asyncio.get_running_loop()
+        # 이벤트 루프가 바뀌었거나 워커가 종료된 경우 큐/워커 재생성
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._batches = set()
+            self._worker = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        await self._queue.put((request, future))
+        return await future
+
+    async def aclose(self) -> None:
+        """워커와 진행 중인 배치 태스크 종료 (이벤트 루프 종료 전에 호출)"""
+        tasks = [*self._batches, self._worker] if self._worker is not None else []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop = self._queue = self._worker = None
+        self._batches = set()
+
+    async def _run(self) -> None:
+        """큐에 쌓인 요청을 모아 배치별 태스크로 디스패치 (진행 중인 배치를 기다리지 않음)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            # window가 설정된 경우에만 추가 요청을 기다림 (기본값 0은 대기 없음)
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except TimeoutError:
+                    break
+            
+            task = loop.create_task(self._dispatch_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _dispatch_batch(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        """배치 내 요청을 병렬 전송하고 결과를 각 future에 전달"""
+        results = await asyncio.gather(
+            *(self._dispatch(request) for request, _ in batch),
+            return_exceptions=True
+        )
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():  # 호출 측에서 취소된 요청
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _dispatch(self, request: dict) -> str:
+        """단일 요청 전송 (전역 동시성 제한 적용)"""
+        async with get_openai_semaphore():
+            response = await self.client.chat.completions.create(**request)
+        return response.choices[0].message.content
+
+
+def get_openai_batcher(api_key: str) -> OpenAIBatcher:
+    """API 키별 공유 OpenAI 마이크로 배처 반환"""
+    batcher = _batchers.get(api_key)
+    if batcher is None:
+        batcher = _batchers[api_key] = OpenAIBatcher(get_async_client(api_key))
+    return batcher
+
+
+async def close_openai_clients() -> None:
+    """공유 배처/클라이언트 종료 및 캐시 비우기 (다음 asyncio.run에서 새 연결 풀 사용)"""
+    batchers = list(_batchers.values())
+    clients = list(_clients.values())
+    _batchers.clear()
+    _clients.clear()
+    for batcher in batchers:
+        await batcher.aclose()
+    for client in clients:
+        await client.close()
\ No newline at end of file
@@ -1,20 +1,26 @@
+import asyncio
 import os
+from collections import OrderedDict
+from io import BytesIO
 from pathlib import Path
 from typing import Optional
-from openai import AsyncOpenAI
-from PIL import Image
-import httpx
 
-from src.core.config import settings
+from src.core.config import get_settings
+from src.core.http import get_shared_client
 from src.core.models import ImageInfo
+from src.core.openai_client import get_async_client, get_openai_semaphore
 from src.interfaces.content_generator import ImageGeneratorInterface
 
+# 이미지 프롬프트 번역 LRU 캐시
+_TRANSLATION_CACHE_SIZE = 512
+_translation_cache: OrderedDict[str, str] = OrderedDict()
+
 
 class OpenAIImageGenerator(ImageGeneratorInterface):
     """OpenAI DALL-E를 사용한 이미지 생성기"""
 
     def __init__(self, api_key: str):
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = get_async_client(api_key)
 
     async def generate_image(
         self, 
@@ -23,62 +29,74 @@ class OpenAIImageGenerator(ImageGeneratorInterface):
         alt_text: Optional[str] = None
     ) -> str:
         """DALL-E로 이미지 생성"""
-        
         # 한국어 프롬프트를 영어로 번역 (간단한 버전)
         english_prompt = await self._translate_prompt(prompt)
         
-        response = await self.client.images.generate(
-            model="dall-e-3",
-            prompt=english_prompt,
-            size="1024x1024",
-            quality="standard",
-            n=1
-        )
+        async with get_openai_semaphore():
+            response = await self.client.images.generate(
+                model="dall-e-3",
+                prompt=english_prompt,
+                size="1024x1024",
+                quality="standard",
+                n=1
+            )
         
         image_url = response.data[0].url
         
         # 이미지 다운로드
-        async with httpx.AsyncClient() as client:
-            response = await client.get(image_url)
-            response.raise_for_status()
-            
-            # 디렉토리 생성
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
-        
-        # WebP로 변환 및 최적화
-        optimized_path = await self._optimize_image(output_path)
+        response = await get_shared_client().get(image_url)
+        response.raise_for_status()
         
-        return optimized_path
+        # 메모리상의 원본을 바로 WebP로 변환 및 최적화 (임시 파일 없음)
+        return await self._optimize_image(response.content, output_path)
 
     async def _translate_prompt(self, korean_prompt: str) -> str:
-        """간단한 프롬프트 번역"""
-        response = await self.client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{
-                "role": "user", 
-                "content": f"다음 한국어 프롬프트를 DALL-E용 영어 프롬프트로 번역해주세요: {korean_prompt}"
-            }],
-            temperature=0.3
-        )
-        return response.choices[0].message.content
-
-    async def _optimize_image(self, image_path: str) -> str:
-        """이미지 최적화 (WebP 변환 + 압축)"""
-        # 원본 이미지 열기
-        with Image.open(image_path) as img:
-            # WebP 경로 생성
-            webp_path = image_path.rsplit('.', 1)[0] + '.webp'
-            
-            # WebP로 변환 및 압축
+        """간단한 프롬프트 번역 (ASCII 입력은 그대로, 동일 프롬프트는 캐시 사용)"""
+        if korean_prompt.isascii():
+            return korean_prompt
+        
+        cached = _translation_cache.get(korean_prompt)
+        if cached is not None:
+            _translation_cache.move_to_end(korean_prompt)
+            return cached
+        
+        async with get_openai_semaphore():
+            response = await self.client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[{
+                    "role": "user", 
+                    "content": (
+                        "다음 한국어 프롬프트를 DALL-E용 영어 프롬프트로 번역해주세요: "
+                        f"{korean_prompt}"
+                    )
+                }],
+                temperature=0.3
+            )
+        translated = response.choices[0].message.content
+        
+        _translation_cache[korean_prompt] = translated
+        if len(_translation_cache) > _TRANSLATION_CACHE_SIZE:
+            _translation_cache.popitem(last=False)
+        return translated
+
+    async def _optimize_image(self, image_bytes: bytes, output_path: str) -> str:
+        """이미지 최적화 (WebP 변환 + 압축, 워커 스레드에서 실행)"""
+        return await asyncio.to_thread(self._optimize_sync, image_bytes, output_path)
+
+    @staticmethod
+    def _optimize_sync(image_bytes: bytes, output_path: str) -> str:
+        """이미지 최적화 동기 구현"""
+        from PIL import Image
+
+        # WebP 경로 생성 및 디렉토리 생성
+        webp_path = Path(output_path).with_suffix('.webp')
+        webp_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 다운로드한 바이트에서 바로 WebP로 변환 및 압축
+        with Image.open(BytesIO(image_bytes)) as img:
             img.save(webp_path, 'WebP', quality=80, optimize=True)
         
-        # 원본 파일 삭제
-        os.remove(image_path)
-        
-        return webp_path
+        return str(webp_path)
 
 
 class ImageProcessor:
@@ -87,7 +105,7 @@ class ImageProcessor:
     @staticmethod
     async def generate_alt_text(image_path: str, topic: str) -> str:
         """이미지에 대한 ALT 텍스트 자동 생성"""
-        client = AsyncOpenAI(api_key=settings.openai_api_key)
+        client = get_async_client(get_settings().openai_api_key)
         
         # 이미지 분석 후 ALT 텍스트 생성
         prompt = f"""
@@ -100,24 +118,26 @@ class ImageProcessor:
 ALT 텍스트만 반환해주세요:
 """
         
-        response = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.3
-        )
+        async with get_openai_semaphore():
+            response = await client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.3
+            )
         
         return response.choices[0].message.content.strip()
 
     @staticmethod
     async def create_featured_image(topic: str, output_dir: str = "images") -> ImageInfo:
         """주제에 맞는 대표 이미지 생성"""
-        generator = OpenAIImageGenerator(settings.openai_api_key)
+        from slugify import slugify
+
+        generator = OpenAIImageGenerator(get_settings().openai_api_key)
         
         # 이미지 프롬프트 생성
         prompt = f"{topic}를 표현하는 현대적이고 전문적인 이미지"
         
         # 파일 경로 생성
-        from slugify import slugify
         filename = f"{slugify(topic)}-featured.webp"
         output_path = os.path.join(output_dir, filename)
         
@@ -136,4 +156,4 @@ ALT 텍스트만 반환해주세요:
 
 def create_image_generator() -> OpenAIImageGenerator:
     """이미지 생성기 팩토리 함수"""
-    return OpenAIImageGenerator(api_key=settings.openai_api_key)
\ No newline at end of file
+    return OpenAIImageGenerator(api_key=get_settings().openai_api_key)
\ No newline at end of file
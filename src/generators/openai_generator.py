@@ -1,10 +1,11 @@
-import json
+from collections import OrderedDict
 from typing import Optional
-from openai import AsyncOpenAI
-from slugify import slugify
 
-from src.core.config import settings
-from src.core.models import PostContent, ScheduleInfo, ImageInfo
+from pydantic_core import from_json
+
+from src.core.config import get_settings
+from src.core.models import PostContent, PostDraft, ScheduleInfo, ImageInfo
+from src.core.openai_client import get_async_client, get_openai_semaphore
 from src.interfaces.content_generator import (
     ContentGeneratorInterface, 
     OutlineGeneratorInterface, 
@@ -17,7 +18,7 @@ class OpenAIOutlineGenerator(OutlineGeneratorInterface):
     """OpenAI를 사용한 개요 생성기"""
 
     def __init__(self, api_key: str, model: str = "gpt-4"):
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = get_async_client(api_key)
         self.model = model
 
     async def generate_outline(self, topic: str) -> list[str]:
@@ -34,35 +35,25 @@ JSON 배열 형태로 반환해주세요:
 ["섹션1", "섹션2", "섹션3", ...]
 """
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7
-        )
+        async with get_openai_semaphore():
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.7
+            )
         
         content = response.choices[0].message.content
         try:
-            return json.loads(content)
-        except json.JSONDecodeError:
+            return from_json(content)
+        except ValueError:
             # JSON 파싱 실패시 줄바꿈으로 분리
             return [line.strip() for line in content.split('\n') if line.strip()]
 
 
-class OpenAIContentWriter(ContentWriterInterface):
-    """OpenAI를 사용한 콘텐츠 작성기"""
-
-    def __init__(self, api_key: str, model: str = "gpt-4"):
-        self.client = AsyncOpenAI(api_key=api_key)
-        self.model = model
-
-    async def write_content(self, topic: str, outline: list[str]) -> str:
-        """개요를 바탕으로 콘텐츠 작성"""
-        outline_text = '\n'.join([f"- {section}" for section in outline])
-        
-        prompt = f"""
-주제: "{topic}"
+_WRITE_PROMPT = """
+주제: "%s"
 개요:
-{outline_text}
+%s
 
 위의 개요를 바탕으로 상세한 블로그 포스트를 작성해주세요.
 다음 조건을 만족해야 합니다:
@@ -76,28 +67,10 @@ class OpenAIContentWriter(ContentWriterInterface):
 HTML 콘텐츠만 반환해주세요 (다른 설명 불필요):
 """
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7
-        )
-        
-        return response.choices[0].message.content
-
-
-class OpenAISEOOptimizer(SEOOptimizerInterface):
-    """OpenAI를 사용한 SEO 최적화기"""
-
-    def __init__(self, api_key: str, model: str = "gpt-4"):
-        self.client = AsyncOpenAI(api_key=api_key)
-        self.model = model
-
-    async def optimize_content(self, content: str, topic: str) -> dict[str, str]:
-        """SEO 최적화된 메타 정보 생성"""
-        prompt = f"""
-주제: "{topic}"
+_SEO_PROMPT = """
+주제: "%s"
 콘텐츠:
-{content[:1000]}...
+%s...
 
 위의 콘텐츠를 바탕으로 SEO 최적화된 메타 정보를 생성해주세요:
 - title: 매력적이고 SEO 친화적인 제목 (60자 이내)
@@ -114,15 +87,66 @@ JSON 형태로 반환해주세요:
 }
 """
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.3
-        )
+# 동일 (주제, 개요) 재시도 시 재사용할 작성 결과 수
+_WRITE_CACHE_SIZE = 64
+
+
+class OpenAIContentWriter(ContentWriterInterface):
+    """OpenAI를 사용한 콘텐츠 작성기"""
+
+    def __init__(self, api_key: str, model: str = "gpt-4"):
+        self.client = get_async_client(api_key)
+        self.model = model
+        self._cache: OrderedDict[tuple[str, tuple[str, ...]], str] = OrderedDict()
+
+    async def write_content(self, topic: str, outline: list[str]) -> str:
+        """개요를 바탕으로 콘텐츠 작성 (동일 입력 재시도 시 캐시 사용)"""
+        cache_key = (topic, tuple(outline))
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
+        
+        outline_text = "- " + "\n- ".join(outline) if outline else ""
+        prompt = _WRITE_PROMPT % (topic, outline_text)
+
+        async with get_openai_semaphore():
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.7
+            )
+        
+        content_html = response.choices[0].message.content
+        self._cache[cache_key] = content_html
+        if len(self._cache) > _WRITE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return content_html
+
+
+class OpenAISEOOptimizer(SEOOptimizerInterface):
+    """OpenAI를 사용한 SEO 최적화기"""
+
+    def __init__(self, api_key: str, model: str = "gpt-4"):
+        self.client = get_async_client(api_key)
+        self.model = model
+
+    async def optimize_content(self, content: str, topic: str) -> dict[str, str]:
+        """SEO 최적화된 메타 정보 생성"""
+        prompt = _SEO_PROMPT % (topic, content[:1000])
+
+        async with get_openai_semaphore():
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.3
+            )
         
         try:
-            return json.loads(response.choices[0].message.content)
-        except json.JSONDecodeError:
+            return from_json(response.choices[0].message.content)
+        except ValueError:
+            from slugify import slugify
+
             # 기본값 반환
             return {
                 "title": topic,
@@ -132,14 +156,77 @@ JSON 형태로 반환해주세요:
             }
 
 
+# response_format=json_object를 지원하는 모델 접두사 (기본값 gpt-4 등 구형 모델은 미지원)
+_JSON_MODE_MODEL_PREFIXES = (
+    "gpt-3.5-turbo", "gpt-4-turbo", "gpt-4-1106", "gpt-4-0125", "gpt-4o", "gpt-4.1", "gpt-5",
+    "o1", "o3", "o4",
+)
+
+# 지원 목록에 있지만 response_format을 400으로 거부한 모델 (장시간 실행 프로세스용)
+_JSON_MODE_UNSUPPORTED_MODELS: set[str] = set()
+
+
+def _supports_json_mode(model: str) -> bool:
+    """모델의 JSON 모드(response_format=json_object) 지원 여부"""
+    if model in _JSON_MODE_UNSUPPORTED_MODELS:
+        return False
+    return model.startswith(_JSON_MODE_MODEL_PREFIXES)
+
+
 class OpenAIContentGenerator(ContentGeneratorInterface):
     """OpenAI 기반 통합 콘텐츠 생성기 (Facade Pattern)"""
 
-    def __init__(self, api_key: str, model: str = "gpt-4"):
+    def __init__(self, api_key: str, model: str = "gpt-4", json_mode: Optional[bool] = None):
+        self.client = get_async_client(api_key)
+        self.model = model
+        # None이면 모델명으로 단일 요청(JSON 모드) 사용 여부 판단
+        self.json_mode = json_mode
         self.outline_generator = OpenAIOutlineGenerator(api_key, model)
         self.content_writer = OpenAIContentWriter(api_key, model)
         self.seo_optimizer = OpenAISEOOptimizer(api_key, model)
 
+    async def generate_draft(self, topic: str) -> PostDraft:
+        """개요 + 본문 + SEO 메타를 단일 요청으로 생성 (JSON 모드)"""
+        prompt = f"""
+주제 "{topic}"에 대한 블로그 포스트를 작성해주세요.
+다음 조건을 만족해야 합니다:
+- outline: 5-8개의 주요 섹션 제목 배열 (SEO와 독자 관심을 고려한 구성)
+- content_html: outline을 따르는 HTML 본문
+  (h1, h2, h3, p, ul, li 태그 사용, 섹션별 2-3 문단, 최소 800단어)
+- title: 매력적이고 SEO 친화적인 제목 (60자 이내)
+- excerpt: 검색 엔진용 설명문 (150자 이내)
+- slug: URL 친화적인 슬러그 (영문)
+- keywords: 관련 키워드 (5개 이내, 쉼표로 구분)
+- 한국어로 작성
+
+다음 키를 가진 JSON 객체만 반환해주세요:
+{{"outline": [...], "content_html": "...", "title": "...",
+ "excerpt": "...", "slug": "...", "keywords": "..."}}
+"""
+
+        async with get_openai_semaphore():
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                response_format={"type": "json_object"},
+                temperature=0.7
+            )
+
+        return PostDraft.model_validate_json(response.choices[0].message.content)
+
+    async def _generate_serial(self, topic: str) -> tuple[list[str], str, dict[str, str]]:
+        """개요 → 콘텐츠 → SEO 순차 생성 (JSON 모드 미지원 모델용)"""
+        # 1. 개요 생성
+        outline = await self.outline_generator.generate_outline(topic)
+        
+        # 2. 콘텐츠 작성
+        content_html = await self.content_writer.write_content(topic, outline)
+        
+        # 3. SEO 최적화
+        seo_meta = await self.seo_optimizer.optimize_content(content_html, topic)
+        
+        return outline, content_html, seo_meta
+
     async def generate_content(
         self, 
         topic: str, 
@@ -149,17 +236,32 @@ class OpenAIContentGenerator(ContentGeneratorInterface):
         **kwargs
     ) -> PostContent:
         """완전한 콘텐츠 생성"""
+        from openai import BadRequestError
+        from pydantic import ValidationError
         
-        # 1. 개요 생성
-        outline = await self.outline_generator.generate_outline(topic)
-        
-        # 2. 콘텐츠 작성
-        content_html = await self.content_writer.write_content(topic, outline)
-        
-        # 3. SEO 최적화
-        seo_meta = await self.seo_optimizer.optimize_content(content_html, topic)
+        # 1-3. JSON 모드 지원 모델은 단일 요청 생성, 미지원 모델은 처음부터 순차 생성
+        json_mode = self.json_mode
+        if json_mode is None:
+            json_mode = _supports_json_mode(self.model)
+        if not json_mode:
+            outline, content_html, seo_meta = await self._generate_serial(topic)
+        else:
+            try:
+                draft = await self.generate_draft(topic)
+                outline = draft.outline
+                content_html = draft.content_html
+                seo_meta = {"excerpt": draft.excerpt, "slug": draft.slug}
+            except BadRequestError as e:
+                # response_format 거부만 폴백 (컨텍스트 길이/콘텐츠 정책 등은 그대로 전파)
+                if e.param != "response_format":
+                    raise
+                _JSON_MODE_UNSUPPORTED_MODELS.add(self.model)
+                outline, content_html, seo_meta = await self._generate_serial(topic)
+            except ValidationError:
+                outline, content_html, seo_meta = await self._generate_serial(topic)
         
         # 4. 기본값 설정
+        settings = get_settings()
         if not schedule_info:
             from src.core.models import ScheduleMode
             schedule_info = ScheduleInfo(mode=ScheduleMode.DRAFT)
@@ -185,7 +287,9 @@ class OpenAIContentGenerator(ContentGeneratorInterface):
 
 def create_openai_content_generator() -> OpenAIContentGenerator:
     """OpenAI 콘텐츠 생성기 팩토리 함수"""
+    settings = get_settings()
     return OpenAIContentGenerator(
         api_key=settings.openai_api_key,
-        model=settings.openai_model
+        model=settings.openai_model,
+        json_mode=settings.openai_json_mode
     )
\ No newline at end of file
@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-from src.core.models import QualityCheckResult, PostContent
+if TYPE_CHECKING:
+    from src.core.models import QualityCheckResult, PostContent
 
 
 class QualityCheckerInterface(ABC):
@@ -1,7 +1,10 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from src.core.models import WordPressPost, WordPressMedia, Category, Tag
+if TYPE_CHECKING:
+    from src.core.models import WordPressPost, WordPressMedia, Category, Tag
 
 
 class WordPressClientInterface(ABC):
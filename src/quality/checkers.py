@@ -1,11 +1,20 @@
+import asyncio
+import hashlib
+import html
+import logging
 import re
-from typing import Optional
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlsplit
 from bs4 import BeautifulSoup
 import httpx
-from openai import AsyncOpenAI
+from openai import BadRequestError
+from pydantic_core import from_json
 
-from src.core.config import settings
+from src.core.config import get_settings
+from src.core.http import get_shared_client
 from src.core.models import QualityCheckResult, PostContent
+from src.core.openai_client import get_openai_batcher
 from src.interfaces.quality_checker import (
     QualityCheckerInterface,
     SpellCheckerInterface,
@@ -14,13 +23,43 @@ from src.interfaces.quality_checker import (
     LinkCheckerInterface
 )
 
+if TYPE_CHECKING:
+    from src.core.config import Settings
+    from src.services.database_service import DatabaseService
+
+logger = logging.getLogger(__name__)
+
+# C 기반 lxml 파서 사용 (html.parser 대비 수 배 빠름, 의존성 미설치 환경에서는 html.parser)
+_HTML_PARSER = "lxml" if find_spec("lxml") else "html.parser"
+
+# 표절 검사용 문장 분리 패턴 및 제외할 접속사
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]\s+')
+_SKIP_SENTENCE_PREFIXES = ('그런데', '하지만', '또한')
+
+# 표절 검사용 웹 검색 요청 헤더
+_PLAGIARISM_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+# 단어 수 계산용 HTML 태그 패턴
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _response_cache_key(model: str, prompt_version: str, text: str) -> str:
+    """OpenAI 응답 캐시 키 생성 (모델 + 프롬프트 버전 + 검사 텍스트)"""
+    return hashlib.sha256(f"{model}|{prompt_version}|{text[:2000]}".encode()).hexdigest()
+
 
 class OpenAISpellChecker(SpellCheckerInterface):
     """OpenAI를 사용한 맞춤법 검사기"""
 
-    def __init__(self, api_key: str, model: str = "gpt-3.5-turbo"):
-        self.client = AsyncOpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-3.5-turbo",
+        cache: Optional["DatabaseService"] = None
+    ):
+        self.batcher = get_openai_batcher(api_key)
         self.model = model
+        self.cache = cache
 
     async def check_spelling(self, text: str) -> list[str]:
         """맞춤법 검사"""
@@ -35,13 +74,17 @@ class OpenAISpellChecker(SpellCheckerInterface):
 오류가 없다면 "오류 없음"이라고 반환해주세요.
 """
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.1
-        )
+        cache_key = _response_cache_key(self.model, "spell_v1", text)
+        result = await self.cache.get_cached_response(cache_key) if self.cache else None
         
-        result = response.choices[0].message.content
+        if result is None:
+            result = await self.batcher.submit(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.1
+            )
+            if self.cache:
+                await self.cache.save_cached_response(cache_key, result)
         
         if "오류 없음" in result:
             return []
@@ -58,9 +101,15 @@ class OpenAISpellChecker(SpellCheckerInterface):
 class SimpleGrammarChecker(GrammarCheckerInterface):
     """간단한 문법 검사기"""
 
-    def __init__(self, api_key: str, model: str = "gpt-3.5-turbo"):
-        self.client = AsyncOpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-3.5-turbo",
+        cache: Optional["DatabaseService"] = None
+    ):
+        self.batcher = get_openai_batcher(api_key)
         self.model = model
+        self.cache = cache
 
     async def check_grammar(self, text: str) -> list[str]:
         """문법 검사"""
@@ -73,13 +122,17 @@ class SimpleGrammarChecker(GrammarCheckerInterface):
 문제없다면 "문법 오류 없음"이라고 반환해주세요.
 """
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.1
-        )
+        cache_key = _response_cache_key(self.model, "grammar_v1", text)
+        result = await self.cache.get_cached_response(cache_key) if self.cache else None
         
-        result = response.choices[0].message.content
+        if result is None:
+            result = await self.batcher.submit(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.1
+            )
+            if self.cache:
+                await self.cache.save_cached_response(cache_key, result)
         
         if "문법 오류 없음" in result:
             return []
@@ -87,9 +140,71 @@ class SimpleGrammarChecker(GrammarCheckerInterface):
         return [result]
 
 
+class CombinedTextChecker:
+    """맞춤법 + 문법 통합 검사기 (단일 OpenAI 요청, JSON 모드)"""
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-3.5-turbo",
+        cache: Optional["DatabaseService"] = None
+    ):
+        self.batcher = get_openai_batcher(api_key)
+        self.model = model
+        self.cache = cache
+
+    async def check(self, text: str) -> dict[str, list[str]]:
+        """맞춤법/문법 통합 검사 (spelling/grammar 목록 반환, 파싱 실패 시 ValueError)"""
+        prompt = f"""
+다음 텍스트의 맞춤법 오류와 문법 오류를 찾아주세요:
+
+{text[:2000]}
+
+다음 형식의 JSON 객체로 반환해주세요:
+{{"spelling": ["[오류] -> [수정안]", ...], "grammar": ["문법 오류 설명", ...]}}
+
+오류가 없는 항목은 빈 배열로 반환해주세요.
+"""
+
+        cache_key = _response_cache_key(self.model, "combined_v1", text)
+        result = await self.cache.get_cached_response(cache_key) if self.cache else None
+        
+        cache_hit = result is not None
+        if not cache_hit:
+            result = await self.batcher.submit(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                response_format={"type": "json_object"},
+                temperature=0.1
+            )
+        
+        payload = from_json(result)
+        if not isinstance(payload, dict):
+            raise ValueError("통합 검사 응답이 JSON 객체가 아닙니다")
+        
+        parsed = {
+            "spelling": [str(error).strip() for error in payload.get("spelling") or []],
+            "grammar": [str(error).strip() for error in payload.get("grammar") or []],
+        }
+        
+        # 캐시 미스이고 파싱에 성공한 응답만 저장 (히트 시 재저장하면 TTL이 연장됨)
+        if self.cache and not cache_hit:
+            await self.cache.save_cached_response(cache_key, result)
+        
+        return parsed
+
+
 class SimplePlagiarismChecker(PlagiarismCheckerInterface):
     """간단한 표절 검사기 (웹 검색 기반)"""
 
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self._client = client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """주입된 클라이언트 또는 앱 공유 클라이언트"""
+        return self._client or get_shared_client()
+
     async def check_plagiarism(self, text: str) -> float:
         """표절 검사 - 유사도 점수 반환"""
         # 텍스트에서 특징적인 구문 추출
@@ -98,12 +213,15 @@ class SimplePlagiarismChecker(PlagiarismCheckerInterface):
         if not sentences:
             return 0.0
         
-        similarity_scores = []
+        # 각 문장에 대해 웹 검색 병렬 수행 (최대 3개 문장만 검사)
+        results = await asyncio.gather(
+            *(self._check_sentence_similarity(sentence) for sentence in sentences[:3]),
+            return_exceptions=True
+        )
         
-        # 각 문장에 대해 웹 검색 수행
-        for sentence in sentences[:3]:  # 최대 3개 문장만 검사
-            score = await self._check_sentence_similarity(sentence)
-            similarity_scores.append(score)
+        similarity_scores = [
+            0.0 if isinstance(result, BaseException) else result for result in results
+        ]
         
         # 평균 유사도 반환
         return sum(similarity_scores) / len(similarity_scores) if similarity_scores else 0.0
@@ -111,16 +229,16 @@ class SimplePlagiarismChecker(PlagiarismCheckerInterface):
     def _extract_unique_sentences(self, text: str) -> list[str]:
         """특징적인 문장 추출"""
         # HTML 태그 제거
-        soup = BeautifulSoup(text, 'html.parser')
+        soup = BeautifulSoup(text, _HTML_PARSER)
         clean_text = soup.get_text()
         
         # 문장 분리
-        sentences = re.split(r'[.!?]\s+', clean_text)
+        sentences = (sentence.strip() for sentence in _SENTENCE_SPLIT_RE.split(clean_text))
         
         # 10글자 이상의 의미있는 문장만 선택
         unique_sentences = [
-            s.strip() for s in sentences 
-            if len(s.strip()) > 10 and not s.strip().startswith(('그런데', '하지만', '또한'))
+            sentence for sentence in sentences
+            if len(sentence) > 10 and not sentence.startswith(_SKIP_SENTENCE_PREFIXES)
         ]
         
         return unique_sentences[:5]  # 최대 5개
@@ -129,21 +247,20 @@ class SimplePlagiarismChecker(PlagiarismCheckerInterface):
         """문장의 웹상 유사도 검사"""
         try:
             # 간단한 웹 검색 (실제로는 더 정교한 API 사용 권장)
-            async with httpx.AsyncClient() as client:
-                # Google 검색 시뮬레이션 (실제로는 검색 API 사용)
-                response = await client.get(
-                    f"https://www.google.com/search?q=\"{sentence}\"",
-                    headers={"User-Agent": "Mozilla/5.0"},
-                    timeout=5.0
-                )
+            # Google 검색 시뮬레이션 (실제로는 검색 API 사용)
+            response = await self.client.get(
+                f"https://www.google.com/search?q=\"{sentence}\"",
+                headers=_PLAGIARISM_HEADERS,
+                timeout=5.0
+            )
+            
+            # 검색 결과가 많으면 유사도가 높다고 가정
+            content = response.text
+            if "검색결과가 없습니다" in content or "did not match" in content:
+                return 0.0
+            else:
+                return 30.0  # 기본 유사도 점수
                 
-                # 검색 결과가 많으면 유사도가 높다고 가정
-                content = response.text
-                if "검색결과가 없습니다" in content or "did not match" in content:
-                    return 0.0
-                else:
-                    return 30.0  # 기본 유사도 점수
-                    
         except Exception:
             return 0.0  # 오류 시 유사도 0
 
@@ -151,38 +268,72 @@ class SimplePlagiarismChecker(PlagiarismCheckerInterface):
 class LinkChecker(LinkCheckerInterface):
     """링크 검사기"""
 
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        max_concurrency: int = 20,
+        per_host_concurrency: int = 6
+    ):
+        self._client = client
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """주입된 클라이언트 또는 앱 공유 클라이언트"""
+        return self._client or get_shared_client()
+
     async def check_links(self, html_content: str) -> list[str]:
-        """404 링크 검사"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        links = soup.find_all('a', href=True)
+        """404 링크 검사 (공유 클라이언트 + 호스트별 동시성 제한)"""
+        soup = BeautifulSoup(html_content, _HTML_PARSER)
+        urls = [
+            link['href'] for link in soup.find_all('a', href=True)
+            if link['href'].startswith(('http://', 'https://'))
+        ]
+        
+        if not urls:
+            return []
         
-        broken_links = []
+        # 느린 호스트가 전체 슬롯을 점유하지 않도록 호스트별 세마포어 적용
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        host_semaphores = {
+            host: asyncio.Semaphore(self.per_host_concurrency)
+            for host in {urlsplit(url).netloc for url in urls}
+        }
+        client = self.client
         
-        for link in links:
-            url = link['href']
-            if url.startswith(('http://', 'https://')):
-                try:
-                    async with httpx.AsyncClient() as client:
-                        response = await client.head(url, timeout=10.0)
-                        if response.status_code >= 400:
-                            broken_links.append(url)
-                except Exception:
-                    broken_links.append(url)
+        async def probe(url: str) -> int:
+            async with host_semaphores[urlsplit(url).netloc], semaphore:
+                response = await client.head(url, timeout=10.0, follow_redirects=True)
+                if response.status_code == 405:
+                    # HEAD 미지원 서버는 첫 바이트만 GET
+                    response = await client.get(
+                        url, headers={"Range": "bytes=0-0"}, timeout=10.0, follow_redirects=True
+                    )
+                return response.status_code
         
-        return broken_links
+        results = await asyncio.gather(*(probe(url) for url in urls), return_exceptions=True)
+        
+        return [
+            url for url, result in zip(urls, results, strict=True)
+            if isinstance(result, BaseException) or result >= 400
+        ]
 
 
 class ComprehensiveQualityChecker(QualityCheckerInterface):
     """종합 품질 검사기 (Composite Pattern)"""
 
-    def __init__(self):
-        self.spell_checker = OpenAISpellChecker(settings.openai_api_key)
-        self.grammar_checker = SimpleGrammarChecker(settings.openai_api_key)
+    def __init__(self, cache: Optional["DatabaseService"] = None):
+        settings = get_settings()
+        self.spell_checker = OpenAISpellChecker(settings.openai_api_key, cache=cache)
+        self.grammar_checker = SimpleGrammarChecker(settings.openai_api_key, cache=cache)
+        self.text_checker = CombinedTextChecker(settings.openai_api_key, cache=cache)
         self.plagiarism_checker = SimplePlagiarismChecker()
         self.link_checker = LinkChecker()
 
     async def check_quality(self, content: PostContent) -> QualityCheckResult:
         """종합 품질 검사"""
+        settings = get_settings()
         issues = []
         suggestions = []
         score = 100.0  # 시작 점수
@@ -196,33 +347,7 @@ class ComprehensiveQualityChecker(QualityCheckerInterface):
             issues.append(f"내용이 너무 깁니다 ({word_count}자, 최대 {settings.max_word_count}자)")
             score -= 10
         
-        # 2. 맞춤법 검사
-        if settings.grammar_check_enabled:
-            spell_errors = await self.spell_checker.check_spelling(content.content_html)
-            if spell_errors:
-                issues.extend(spell_errors)
-                score -= len(spell_errors) * 5
-        
-        # 3. 문법 검사  
-        grammar_errors = await self.grammar_checker.check_grammar(content.content_html)
-        if grammar_errors:
-            issues.extend(grammar_errors)
-            score -= len(grammar_errors) * 3
-        
-        # 4. 표절 검사
-        if settings.plagiarism_check_enabled:
-            similarity_score = await self.plagiarism_checker.check_plagiarism(content.content_html)
-            if similarity_score > 50:
-                issues.append(f"높은 유사도 검출: {similarity_score:.1f}%")
-                score -= similarity_score / 2
-        
-        # 5. 링크 검사
-        broken_links = await self.link_checker.check_links(content.content_html)
-        if broken_links:
-            issues.extend([f"깨진 링크: {link}" for link in broken_links])
-            score -= len(broken_links) * 10
-        
-        # 6. SEO 검사
+        # 2. SEO 검사
         if not content.excerpt or len(content.excerpt) < 50:
             issues.append("메타 설명이 너무 짧습니다")
             score -= 5
@@ -231,34 +356,117 @@ class ComprehensiveQualityChecker(QualityCheckerInterface):
             issues.append("슬러그가 너무 깁니다")
             score -= 3
         
-        # 7. 개선 제안 생성
+        # 3. 개선 제안 생성
         if word_count < 1000:
             suggestions.append("더 자세한 내용을 추가하여 독자에게 더 많은 가치를 제공하세요")
         
         if not content.images:
             suggestions.append("시각적 요소를 추가하여 독자 경험을 향상시키세요")
         
-        # 최종 점수 계산
+        # 최소 분량 미달은 점수와 무관하게 불합격이므로 API/HTTP 호출 생략
+        if word_count < settings.min_word_count:
+            return self._build_result(score, issues, suggestions, rejected=True)
+        
+        # 4-7. 외부 검사 병렬 실행 (맞춤법/문법, 표절, 링크)
+        results = await self._run_external_checks(content.content_html, settings)
+        
+        # 4-5. 맞춤법 + 문법 검사
+        spell_errors, grammar_errors = results.get("text") or ([], [])
+        if spell_errors:
+            issues.extend(spell_errors)
+            score -= len(spell_errors) * 5
+        
+        if grammar_errors:
+            issues.extend(grammar_errors)
+            score -= len(grammar_errors) * 3
+        
+        # 6. 표절 검사
+        similarity_score = results.get("plagiarism") or 0.0
+        if similarity_score > 50:
+            issues.append(f"높은 유사도 검출: {similarity_score:.1f}%")
+            score -= similarity_score / 2
+        
+        # 7. 링크 검사
+        broken_links = results.get("links") or []
+        if broken_links:
+            issues.extend([f"깨진 링크: {link}" for link in broken_links])
+            score -= len(broken_links) * 10
+        
+        return self._build_result(score, issues, suggestions)
+
+    @staticmethod
+    def _is_rejected(score: float, issues: list[str]) -> bool:
+        """불합격 여부 (점수 70 미만 또는 이슈 3개 초과)"""
+        return score < 70 or len(issues) > 3
+
+    def _build_result(
+        self,
+        score: float,
+        issues: list[str],
+        suggestions: list[str],
+        rejected: bool = False
+    ) -> QualityCheckResult:
+        """최종 점수 계산 및 결과 생성 (rejected=True면 점수와 무관하게 불합격)"""
         final_score = max(0, min(100, score))
-        passed = final_score >= 70 and len(issues) <= 3
         
         return QualityCheckResult(
-            passed=passed,
+            passed=not rejected and not self._is_rejected(final_score, issues),
             score=final_score,
             issues=issues,
             suggestions=suggestions
         )
 
+    async def _run_external_checks(self, html_content: str, settings: "Settings") -> dict:
+        """I/O 기반 검사를 병렬 실행 (실패한 검사는 경고 후 건너뜀)"""
+        checks = {
+            "text": self._check_text(
+                html_content,
+                include_spelling=settings.grammar_check_enabled
+            ),
+        }
+        # 앵커 태그가 없으면 HTML 파싱 및 링크 검사 생략
+        if "<a " in html_content:
+            checks["links"] = self.link_checker.check_links(html_content)
+        if settings.plagiarism_check_enabled:
+            checks["plagiarism"] = self.plagiarism_checker.check_plagiarism(html_content)
+        
+        outcomes = await asyncio.gather(*checks.values(), return_exceptions=True)
+        
+        results = {}
+        for name, outcome in zip(checks, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.warning("품질 검사 '%s' 실패로 건너뜀: %s", name, outcome)
+                continue
+            results[name] = outcome
+        return results
+
+    async def _check_text(
+        self,
+        html_content: str,
+        include_spelling: bool
+    ) -> tuple[list[str], list[str]]:
+        """맞춤법/문법 검사 (통합 요청 우선, 실패 시 개별 검사기로 폴백)"""
+        if not include_spelling:
+            return [], await self.grammar_checker.check_grammar(html_content)
+        
+        try:
+            combined = await self.text_checker.check(html_content)
+            return combined["spelling"], combined["grammar"]
+        except (BadRequestError, ValueError):
+            spell_errors = await self.spell_checker.check_spelling(html_content)
+            grammar_errors = await self.grammar_checker.check_grammar(html_content)
+            return spell_errors, grammar_errors
+
     def _count_words(self, html_content: str) -> int:
-        """단어 수 계산"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        text = soup.get_text()
+        """단어 수 계산 (DOM 생성 없이 태그 제거 후 공백 기준 분리)"""
+        text = html.unescape(_TAG_RE.sub(' ', html_content))
         
         # 한국어 단어 수 계산 (공백 기준)
-        words = len([word for word in text.split() if word.strip()])
-        return words
+        return len(text.split())
 
 
-def create_quality_checker() -> ComprehensiveQualityChecker:
+def create_quality_checker(
+    cache: Optional["DatabaseService"] = None
+) -> ComprehensiveQualityChecker:
     """품질 검사기 팩토리 함수"""
-    return ComprehensiveQualityChecker()
\ No newline at end of file
+    return ComprehensiveQualityChecker(cache=cache)
\ No newline at end of file
@@ -1,9 +1,9 @@
+import asyncio
 import uuid
 from datetime import datetime
 from typing import Optional
-from slugify import slugify
 
-from src.core.config import settings
+from src.core.config import get_settings
 from src.core.models import (
     PostContent, 
     WordPressPost, 
@@ -25,8 +25,19 @@ class BlogService:
     def __init__(self):
         self.wp_client = create_wordpress_client()
         self.content_generator = create_openai_content_generator()
-        self.quality_checker = create_quality_checker()
         self.db_service = DatabaseService()
+        self.quality_checker = create_quality_checker(cache=self.db_service)
+
+    async def __aenter__(self) -> "BlogService":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """WordPress 클라이언트 및 DB 연결 정리 (공유 HTTP 클라이언트는 앱 종료 시 정리)"""
+        await self.wp_client.aclose()
+        await self.db_service.close()
 
     async def create_and_publish_post(
         self,
@@ -45,24 +56,32 @@ class BlogService:
             topic=topic,
             status="started",
             created_at=datetime.now(),
-            scheduled_at=schedule_info.datetime if schedule_info.mode == ScheduleMode.SCHEDULE else None
+            scheduled_at=(
+                schedule_info.scheduled_at
+                if schedule_info.mode == ScheduleMode.SCHEDULE
+                else None
+            )
         )
         
         await self.db_service.save_job(job)
         
         try:
-            # 2. 콘텐츠 생성
-            content = await self.content_generator.generate_content(
+            # 2-3. 콘텐츠 생성 + 이미지 생성 (서로 독립적이므로 병렬 실행)
+            # gather는 첫 예외를 그대로 전파하므로 작업 오류 메시지에 원인이 남음
+            content_coro = self.content_generator.generate_content(
                 topic=topic,
                 schedule_info=schedule_info,
                 categories=categories,
                 tags=tags
             )
-            
-            # 3. 이미지 생성 (선택사항)
             if generate_image:
-                featured_image = await ImageProcessor.create_featured_image(topic)
+                content, featured_image = await asyncio.gather(
+                    content_coro,
+                    ImageProcessor.create_featured_image(topic)
+                )
                 content.images = [featured_image]
+            else:
+                content = await content_coro
             
             # 4. 품질 검사
             quality_result = await self.quality_checker.check_quality(content)
@@ -71,23 +90,27 @@ class BlogService:
                 # 품질 검사 실패 시 임시글로 저장
                 content.schedule.mode = ScheduleMode.DRAFT
             
-            # 5. WordPress 카테고리/태그 처리
-            wp_categories = await self._get_or_create_categories(content.categories)
-            wp_tags = await self._get_or_create_tags(content.tags)
+            # 5. WordPress 카테고리/태그 처리 (독립 조회이므로 병렬 실행)
+            wp_categories, wp_tags = await asyncio.gather(
+                self._get_or_create_categories(content.categories),
+                self._get_or_create_tags(content.tags)
+            )
+            
+            # 6. 이미지 업로드 (병렬 업로드 후 대표 이미지 선택)
+            uploaded_media = await asyncio.gather(*(
+                self.wp_client.upload_media(
+                    file_path=image.path,
+                    title=f"{topic} - {'대표 이미지' if image.use_as_featured else '이미지'}",
+                    alt_text=image.alt
+                )
+                for image in content.images
+            ))
             
-            # 6. 이미지 업로드
             featured_media_id = None
-            if content.images:
-                for image in content.images:
-                    if image.use_as_featured:
-                        media = await self.wp_client.upload_media(
-                            file_path=image.path,
-                            title=f"{topic} - 대표 이미지",
-                            alt_text=image.alt
-                        )
-                        featured_media_id = media.id
-                        image.wp_media_id = media.id
-                        break
+            for image, media in zip(content.images, uploaded_media, strict=True):
+                image.wp_media_id = media.id
+                if image.use_as_featured and featured_media_id is None:
+                    featured_media_id = media.id
             
             # 7. WordPress 포스트 생성
             wp_post = WordPressPost(
@@ -96,7 +119,7 @@ class BlogService:
                 excerpt=content.excerpt,
                 slug=content.slug,
                 status=self._get_wp_status(content.schedule.mode),
-                date=content.schedule.datetime,
+                date=content.schedule.scheduled_at,
                 categories=[cat.id for cat in wp_categories],
                 tags=[tag.id for tag in wp_tags],
                 featured_media=featured_media_id
@@ -117,7 +140,7 @@ class BlogService:
                 "wp_post_id": created_post.id,
                 "title": created_post.title,
                 "status": created_post.status.value,
-                "url": f"{settings.wordpress_url}/{created_post.slug}",
+                "url": f"{get_settings().wordpress_url}/{created_post.slug}",
                 "quality_score": quality_result.score,
                 "quality_passed": quality_result.passed,
                 "quality_issues": quality_result.issues
@@ -158,44 +181,34 @@ class BlogService:
         )
 
     async def _get_or_create_categories(self, category_names: list[str]) -> list:
-        """카테고리 조회 또는 생성"""
-        existing_categories = await self.wp_client.get_categories()
-        existing_names = {cat.name: cat for cat in existing_categories}
+        """카테고리 조회 또는 생성 (누락된 항목은 병렬 생성)"""
+        # 목록은 WordPressClient의 TTL/ETag 캐시에서 조회
+        existing_names = {item.name: item for item in await self.wp_client.get_categories()}
         
-        result_categories = []
-        
-        for name in category_names:
-            if name in existing_names:
-                result_categories.append(existing_names[name])
-            else:
-                # 새 카테고리 생성
-                new_category = await self.wp_client.create_category(
-                    name=name,
-                    slug=slugify(name)
-                )
-                result_categories.append(new_category)
+        # 새 카테고리 생성 (슬러그는 클라이언트가 이름에서 생성)
+        to_create = [name for name in dict.fromkeys(category_names) if name not in existing_names]
+        created = await asyncio.gather(*(
+            self.wp_client.create_category(name=name, slug="")
+            for name in to_create
+        ))
+        existing_names.update(zip(to_create, created, strict=True))
         
-        return result_categories
+        return [existing_names[name] for name in category_names]
 
     async def _get_or_create_tags(self, tag_names: list[str]) -> list:
-        """태그 조회 또는 생성"""
-        existing_tags = await self.wp_client.get_tags()
-        existing_names = {tag.name: tag for tag in existing_tags}
-        
-        result_tags = []
+        """태그 조회 또는 생성 (누락된 항목은 병렬 생성)"""
+        # 목록은 WordPressClient의 TTL/ETag 캐시에서 조회
+        existing_names = {item.name: item for item in await self.wp_client.get_tags()}
         
-        for name in tag_names:
-            if name in existing_names:
-                result_tags.append(existing_names[name])
-            else:
-                # 새 태그 생성
-                new_tag = await self.wp_client.create_tag(
-                    name=name,
-                    slug=slugify(name)
-                )
-                result_tags.append(new_tag)
+        # 새 태그 생성 (슬러그는 클라이언트가 이름에서 생성)
+        to_create = [name for name in dict.fromkeys(tag_names) if name not in existing_names]
+        created = await asyncio.gather(*(
+            self.wp_client.create_tag(name=name, slug="")
+            for name in to_create
+        ))
+        existing_names.update(zip(to_create, created, strict=True))
         
-        return result_tags
+        return [existing_names[name] for name in tag_names]
 
     def _get_wp_status(self, schedule_mode: ScheduleMode) -> PostStatus:
         """스케줄 모드를 WordPress 상태로 변환"""
@@ -1,21 +1,37 @@
-import json
+import asyncio
+import zlib
 import aiosqlite
-from datetime import datetime
+from datetime import datetime, time, timedelta
 from pathlib import Path
 from typing import Optional
 
-from src.core.config import settings
+from src.core.config import get_settings
 from src.core.models import GenerationJob, PostContent
 
+# generation_jobs.content_blob 압축 레벨 (zlib)
+CONTENT_COMPRESSION_LEVEL = 6
+
+# 쓰기 처리량 튜닝: WAL + NORMAL 동기화 (커밋마다 fsync 하지 않음), 20MB 캐시, 128MB mmap
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=134217728",
+)
+
 
 class DatabaseService:
     """데이터베이스 서비스 (Repository Pattern)"""
     
     def __init__(self):
         self.db_path = self._get_db_path()
+        self._db: Optional[aiosqlite.Connection] = None
+        self._lock = asyncio.Lock()
         
     def _get_db_path(self) -> str:
         """데이터베이스 경로 생성"""
+        settings = get_settings()
         if settings.database_url.startswith("sqlite:///"):
             path = settings.database_url.replace("sqlite:///", "")
             # 상대 경로를 절대 경로로 변환
@@ -28,107 +44,178 @@ class DatabaseService:
         else:
             raise ValueError("현재 SQLite만 지원됩니다")
 
+    async def connect(self) -> aiosqlite.Connection:
+        """영속 연결 반환 (최초 호출 시 연결 및 스키마 초기화)"""
+        if self._db is not None:
+            return self._db
+        
+        async with self._lock:
+            if self._db is None:
+                db = await aiosqlite.connect(self.db_path)
+                db.row_factory = aiosqlite.Row
+                for pragma in _CONNECTION_PRAGMAS:
+                    await db.execute(pragma)
+                await self._create_schema(db)
+                self._db = db
+        
+        return self._db
+
+    async def close(self):
+        """영속 연결 종료"""
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
     async def init_database(self):
         """데이터베이스 초기화"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS generation_jobs (
-                    id TEXT PRIMARY KEY,
-                    topic TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    created_at TIMESTAMP NOT NULL,
-                    scheduled_at TIMESTAMP,
-                    completed_at TIMESTAMP,
-                    wp_post_id INTEGER,
-                    error_message TEXT,
-                    content_json TEXT
-                )
-            """)
-            
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS posts (
-                    id INTEGER PRIMARY KEY,
-                    wp_post_id INTEGER,
-                    title TEXT,
-                    slug TEXT,
-                    status TEXT,
-                    created_at TIMESTAMP,
-                    quality_score REAL,
-                    job_id TEXT,
-                    FOREIGN KEY (job_id) REFERENCES generation_jobs (id)
-                )
-            """)
-            
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS prompts_log (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    job_id TEXT,
-                    prompt_type TEXT,
-                    prompt_text TEXT,
-                    response_text TEXT,
-                    created_at TIMESTAMP,
-                    FOREIGN KEY (job_id) REFERENCES generation_jobs (id)
-                )
-            """)
-            
-            await db.commit()
+        await self.connect()
+
+    async def _create_schema(self, db: aiosqlite.Connection):
+        """테이블 생성"""
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS generation_jobs (
+                id TEXT PRIMARY KEY,
+                topic TEXT NOT NULL,
+                status TEXT NOT NULL,
+                created_at TIMESTAMP NOT NULL,
+                scheduled_at TIMESTAMP,
+                completed_at TIMESTAMP,
+                wp_post_id INTEGER,
+                error_message TEXT,
+                content_json TEXT,
+                content_blob BLOB
+            )
+        """)
+        
+        # 기존 DB 마이그레이션: 압축 콘텐츠 컬럼 추가
+        async with db.execute("PRAGMA table_info(generation_jobs)") as cursor:
+            columns = {row[1] for row in await cursor.fetchall()}
+        if "content_blob" not in columns:
+            await db.execute("ALTER TABLE generation_jobs ADD COLUMN content_blob BLOB")
+        
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS posts (
+                id INTEGER PRIMARY KEY,
+                wp_post_id INTEGER,
+                title TEXT,
+                slug TEXT,
+                status TEXT,
+                created_at TIMESTAMP,
+                quality_score REAL,
+                job_id TEXT,
+                FOREIGN KEY (job_id) REFERENCES generation_jobs (id)
+            )
+        """)
+        
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS prompts_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id TEXT,
+                prompt_type TEXT,
+                prompt_text TEXT,
+                response_text TEXT,
+                created_at TIMESTAMP,
+                FOREIGN KEY (job_id) REFERENCES generation_jobs (id)
+            )
+        """)
+        
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS openai_cache (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at TIMESTAMP NOT NULL
+            )
+        """)
+        
+        # 최근 작업 목록/통계 조회용 인덱스
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON generation_jobs (created_at DESC)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_status_created "
+            "ON generation_jobs (status, created_at DESC)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_prompts_log_job_created "
+            "ON prompts_log (job_id, created_at)"
+        )
+        
+        await db.commit()
 
     async def save_job(self, job: GenerationJob):
         """작업 저장"""
-        await self.init_database()
+        db = await self.connect()
         
-        async with aiosqlite.connect(self.db_path) as db:
-            content_json = None
-            if job.content:
-                content_json = job.content.model_dump_json()
-            
-            await db.execute("""
-                INSERT OR REPLACE INTO generation_jobs 
-                (id, topic, status, created_at, scheduled_at, completed_at, wp_post_id, error_message, content_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                job.id,
-                job.topic,
-                job.status,
-                job.created_at,
-                job.scheduled_at,
-                job.completed_at,
-                job.wp_post_id,
-                job.error_message,
-                content_json
-            ))
-            
-            await db.commit()
+        # 콘텐츠는 zlib 압축하여 BLOB으로 저장
+        content_blob = None
+        if job.content:
+            content_blob = zlib.compress(
+                job.content.model_dump_json().encode(), CONTENT_COMPRESSION_LEVEL
+            )
+        
+        # UPSERT: 기존 행은 변경 컬럼만 갱신 (content_blob은 새 값이 있을 때만)
+        await db.execute("""
+            INSERT INTO generation_jobs 
+            (id, topic, status, created_at, scheduled_at, completed_at,
+             wp_post_id, error_message, content_blob)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                status = excluded.status,
+                completed_at = excluded.completed_at,
+                wp_post_id = excluded.wp_post_id,
+                error_message = excluded.error_message,
+                content_blob = COALESCE(excluded.content_blob, generation_jobs.content_blob)
+        """, (
+            job.id,
+            job.topic,
+            job.status,
+            job.created_at,
+            job.scheduled_at,
+            job.completed_at,
+            job.wp_post_id,
+            job.error_message,
+            content_blob
+        ))
+        
+        await db.commit()
 
     async def get_job(self, job_id: str) -> Optional[GenerationJob]:
         """작업 조회"""
-        await self.init_database()
-        
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("""
-                SELECT * FROM generation_jobs WHERE id = ?
-            """, (job_id,)) as cursor:
-                row = await cursor.fetchone()
-                
-                if not row:
-                    return None
-                
-                content = None
-                if row[8]:  # content_json
-                    content_dict = json.loads(row[8])
-                    content = PostContent(**content_dict)
-                
-                return GenerationJob(
-                    id=row[0],
-                    topic=row[1],
-                    status=row[2],
-                    created_at=datetime.fromisoformat(row[3]),
-                    scheduled_at=datetime.fromisoformat(row[4]) if row[4] else None,
-                    completed_at=datetime.fromisoformat(row[5]) if row[5] else None,
-                    wp_post_id=row[6],
-                    error_message=row[7],
-                    content=content
-                )
+        db = await self.connect()
+        
+        async with db.execute("""
+            SELECT id, topic, status, created_at, scheduled_at, completed_at,
+                   wp_post_id, error_message, content_json, content_blob
+            FROM generation_jobs WHERE id = ?
+        """, (job_id,)) as cursor:
+            row = await cursor.fetchone()
+            
+            if not row:
+                return None
+            
+            content = None
+            if row["content_blob"]:  # zlib 압축 콘텐츠
+                content = PostContent.model_validate_json(zlib.decompress(row["content_blob"]))
+            elif row["content_json"]:  # 압축 도입 이전 행
+                content = PostContent.model_validate_json(row["content_json"])
+            
+            # detect_types 대신 fromisoformat 사용: sqlite3 기본 TIMESTAMP 변환기는
+            # 타임존 오프셋을 버리고, 3.12부터 기본 어댑터/변환기가 deprecated
+            return GenerationJob(
+                id=row["id"],
+                topic=row["topic"],
+                status=row["status"],
+                created_at=datetime.fromisoformat(row["created_at"]),
+                scheduled_at=(
+                    datetime.fromisoformat(row["scheduled_at"]) if row["scheduled_at"] else None
+                ),
+                completed_at=(
+                    datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None
+                ),
+                wp_post_id=row["wp_post_id"],
+                error_message=row["error_message"],
+                content=content
+            )
 
     async def get_recent_jobs(
         self, 
@@ -136,8 +223,6 @@ class DatabaseService:
         status: Optional[str] = None
     ) -> list[dict]:
         """최근 작업 목록 조회"""
-        await self.init_database()
-        
         query = """
             SELECT id, topic, status, created_at, completed_at, wp_post_id, error_message
             FROM generation_jobs
@@ -151,24 +236,25 @@ class DatabaseService:
         query += " ORDER BY created_at DESC LIMIT ?"
         params.append(limit)
         
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute(query, params) as cursor:
-                rows = await cursor.fetchall()
-                
-                results = []
-                for row in rows:
-                    results.append({
-                        "id": row[0],
-                        "title": row[1],  # topic을 title로 사용
-                        "status": row[2],
-                        "created_at": row[3],
-                        "completed_at": row[4],
-                        "wp_post_id": row[5],
-                        "error_message": row[6],
-                        "quality_score": "N/A"  # 품질 점수는 별도 계산 필요
-                    })
-                
-                return results
+        db = await self.connect()
+        
+        async with db.execute(query, params) as cursor:
+            rows = await cursor.fetchall()
+            
+            results = []
+            for row in rows:
+                results.append({
+                    "id": row["id"],
+                    "title": row["topic"],  # topic을 title로 사용
+                    "status": row["status"],
+                    "created_at": row["created_at"],
+                    "completed_at": row["completed_at"],
+                    "wp_post_id": row["wp_post_id"],
+                    "error_message": row["error_message"],
+                    "quality_score": "N/A"  # 품질 점수는 별도 계산 필요
+                })
+            
+            return results
 
     async def save_prompt_log(
         self,
@@ -178,69 +264,111 @@ class DatabaseService:
         response_text: str
     ):
         """프롬프트 로그 저장"""
-        await self.init_database()
-        
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                INSERT INTO prompts_log (job_id, prompt_type, prompt_text, response_text, created_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                job_id,
-                prompt_type,
-                prompt_text,
-                response_text,
-                datetime.now()
-            ))
-            
-            await db.commit()
+        db = await self.connect()
+        
+        await db.execute("""
+            INSERT INTO prompts_log (job_id, prompt_type, prompt_text, response_text, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, (
+            job_id,
+            prompt_type,
+            prompt_text,
+            response_text,
+            datetime.now()
+        ))
+        
+        await db.commit()
+
+    async def save_prompt_logs(self, logs: list[tuple[str, str, str, str]]):
+        """프롬프트 로그 일괄 저장 (job_id, prompt_type, prompt_text, response_text 튜플 목록)"""
+        if not logs:
+            return
+        
+        db = await self.connect()
+        now = datetime.now()
+        
+        await db.executemany("""
+            INSERT INTO prompts_log (job_id, prompt_type, prompt_text, response_text, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, [(*log, now) for log in logs])
+        
+        await db.commit()
 
     async def get_prompt_logs(self, job_id: str) -> list[dict]:
         """프롬프트 로그 조회"""
-        await self.init_database()
-        
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("""
-                SELECT prompt_type, prompt_text, response_text, created_at
-                FROM prompts_log
-                WHERE job_id = ?
-                ORDER BY created_at
-            """, (job_id,)) as cursor:
-                rows = await cursor.fetchall()
-                
-                return [
-                    {
-                        "prompt_type": row[0],
-                        "prompt_text": row[1],
-                        "response_text": row[2],
-                        "created_at": row[3]
-                    }
-                    for row in rows
-                ]
+        db = await self.connect()
+        
+        async with db.execute("""
+            SELECT prompt_type, prompt_text, response_text, created_at
+            FROM prompts_log
+            WHERE job_id = ?
+            ORDER BY created_at
+        """, (job_id,)) as cursor:
+            rows = await cursor.fetchall()
+            
+            return [
+                {
+                    "prompt_type": row[0],
+                    "prompt_text": row[1],
+                    "response_text": row[2],
+                    "created_at": row[3]
+                }
+                for row in rows
+            ]
+
+    async def get_cached_response(
+        self,
+        key: str,
+        ttl: timedelta = timedelta(hours=6)
+    ) -> Optional[str]:
+        """OpenAI 응답 캐시 조회 (TTL 이내 항목만)"""
+        db = await self.connect()
+        
+        async with db.execute(
+            "SELECT response FROM openai_cache WHERE key = ? AND created_at >= ?",
+            (key, datetime.now() - ttl)
+        ) as cursor:
+            row = await cursor.fetchone()
+            return row[0] if row else None
+
+    async def save_cached_response(self, key: str, response: str):
+        """OpenAI 응답 캐시 저장"""
+        db = await self.connect()
+        
+        await db.execute("""
+            INSERT OR REPLACE INTO openai_cache (key, response, created_at)
+            VALUES (?, ?, ?)
+        """, (key, response, datetime.now()))
+        
+        await db.commit()
 
     async def get_statistics(self) -> dict:
         """통계 정보 조회"""
-        await self.init_database()
+        db = await self.connect()
         
-        async with aiosqlite.connect(self.db_path) as db:
-            # 총 작업 수
-            async with db.execute("SELECT COUNT(*) FROM generation_jobs") as cursor:
-                total_jobs = (await cursor.fetchone())[0]
-            
-            # 성공/실패 작업 수
-            async with db.execute("SELECT status, COUNT(*) FROM generation_jobs GROUP BY status") as cursor:
-                status_counts = {row[0]: row[1] for row in await cursor.fetchall()}
-            
-            # 오늘 생성된 작업 수
-            today = datetime.now().date()
-            async with db.execute(
-                "SELECT COUNT(*) FROM generation_jobs WHERE date(created_at) = ?",
-                (today,)
-            ) as cursor:
-                today_jobs = (await cursor.fetchone())[0]
-            
-            return {
-                "total_jobs": total_jobs,
-                "status_counts": status_counts,
-                "today_jobs": today_jobs,
-                "success_rate": status_counts.get("completed", 0) / total_jobs * 100 if total_jobs > 0 else 0
-            }
\ No newline at end of file
+        # 총 작업 수
+        async with db.execute("SELECT COUNT(*) FROM generation_jobs") as cursor:
+            total_jobs = (await cursor.fetchone())[0]
+        
+        # 성공/실패 작업 수
+        async with db.execute(
+            "SELECT status, COUNT(*) FROM generation_jobs GROUP BY status"
+        ) as cursor:
+            status_counts = {row[0]: row[1] for row in await cursor.fetchall()}
+        
+        # 오늘 생성된 작업 수 (인덱스를 타도록 범위 조건 사용)
+        today_start = datetime.combine(datetime.now().date(), time.min)
+        async with db.execute(
+            "SELECT COUNT(*) FROM generation_jobs WHERE created_at >= ? AND created_at < ?",
+            (today_start, today_start + timedelta(days=1))
+        ) as cursor:
+            today_jobs = (await cursor.fetchone())[0]
+        
+        return {
+            "total_jobs": total_jobs,
+            "status_counts": status_counts,
+            "today_jobs": today_jobs,
+            "success_rate": (
+                status_counts.get("completed", 0) / total_jobs * 100 if total_jobs > 0 else 0
+            )
+        }
\ No newline at end of file
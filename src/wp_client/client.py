@@ -1,15 +1,136 @@
+import asyncio
 import base64
+import os
+import time
 from datetime import datetime
+from functools import lru_cache
+from importlib.util import find_spec
+from operator import itemgetter
+from collections.abc import AsyncIterator
 from typing import Optional
 import aiofiles
 import httpx
+from pydantic_core import from_json, to_json
 from slugify import slugify
 
-from src.core.config import settings
+from src.core.config import get_settings
 from src.core.models import WordPressPost, WordPressMedia, Category, Tag, PostStatus
 from src.interfaces.wordpress_client import WordPressClientInterface
 
 
+# batch/v1 요청당 최대 하위 요청 수 (WordPress 기본값)
+BATCH_MAX_REQUESTS = 25
+
+# JSON 본문 요청 헤더 (본문은 pydantic_core.to_json으로 직접 직렬화)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# 카테고리/태그 목록 캐시 유지 시간 (초)
+TAXONOMY_CACHE_TTL = 300
+
+# 카테고리/태그 목록 페이지 크기 (REST API 최대값)
+TAXONOMY_PAGE_SIZE = 100
+
+# 미디어 업로드 시 디스크에서 읽는 청크 크기
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# 재시도 대상 (멱등 메서드 + 일시적 오류 상태 코드)
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# 부분 조회(_fields) 시에도 항상 요청하는 포스트 필드 (WordPressPost 필수값)
+POST_REQUIRED_FIELDS = ("id", "slug", "status")
+
+# 카테고리/태그 목록은 모델에 필요한 필드만 요청
+TAXONOMY_FIELDS = "id,name,slug"
+
+# 카테고리/태그 이름 → 슬러그 변환 캐시 (대량 생성 시 같은 이름이 반복됨)
+_slugify_cached = lru_cache(maxsize=4096)(slugify)
+
+# 카테고리/태그 응답에서 (id, name, slug) 추출
+_term_fields = itemgetter("id", "name", "slug")
+
+
+def _rendered_or_raw(field: Optional[dict]) -> str:
+    """title/content/excerpt 필드 값 추출 (context=edit의 raw 우선)"""
+    if not field:
+        return ""
+    return field.get("raw", field.get("rendered", ""))
+
+
+def _build_post_payload(post: WordPressPost) -> dict:
+    """WordPressPost를 REST API 요청 본문으로 변환 (선택 필드는 값이 있을 때만 포함)"""
+    return {
+        "title": post.title,
+        "content": post.content,
+        "excerpt": post.excerpt,
+        "slug": post.slug,
+        "status": post.status.value,
+        "categories": post.categories,
+        "tags": post.tags,
+        **{
+            key: value
+            for key, value in (
+                ("featured_media", post.featured_media),
+                ("date", post.date),
+                ("meta", post.meta),
+            )
+            if value
+        },
+    }
+
+
+async def _file_chunks(file_path: str, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """파일을 청크 단위로 비동기 읽기"""
+    async with aiofiles.open(file_path, 'rb') as file:
+        while chunk := await file.read(chunk_size):
+            yield chunk
+
+
+class BatchCreateError(ValueError):
+    """일괄 생성 실패 (실패 전까지 생성된 포스트 응답 본문을 created에 보관)"""
+
+    def __init__(self, message: str, created: list[dict]):
+        super().__init__(message)
+        self.created = created
+
+    @property
+    def created_ids(self) -> list[int]:
+        """이미 생성된 포스트 ID (재시도 시 중복 생성 방지용)"""
+        return [body["id"] for body in self.created]
+
+
+class _RetryTransport(httpx.AsyncBaseTransport):
+    """멱등 요청(GET/PUT/DELETE 등)의 일시적 오류 응답을 지수 백오프로 재시도하는 트랜스포트"""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        retries: int = 3,
+        backoff_factor: float = 0.5
+    ):
+        self._transport = transport
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = await self._transport.handle_async_request(request)
+            if (
+                request.method not in RETRY_METHODS
+                or response.status_code not in RETRY_STATUS_CODES
+                or attempt >= self.retries
+            ):
+                return response
+            
+            await response.aclose()
+            await asyncio.sleep(self.backoff_factor * 2 ** attempt)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
 class WordPressClient(WordPressClientInterface):
     """WordPress REST API 클라이언트 구현"""
 
@@ -22,263 +143,351 @@ class WordPressClient(WordPressClientInterface):
         # Basic Auth 헤더 생성
         credentials = f"{username}:{app_password}"
         encoded_credentials = base64.b64encode(credentials.encode()).decode()
-        self.headers = {
-            "Authorization": f"Basic {encoded_credentials}",
-            "Content-Type": "application/json"
-        }
+        self._auth_header = f"Basic {encoded_credentials}"
+        self.headers = {**JSON_HEADERS, "Authorization": self._auth_header}
+        
+        # 모든 요청이 공유하는 연결 풀 (keep-alive 재사용, h2 설치 시 HTTP/2 다중화)
+        # 연결 오류는 AsyncHTTPTransport가, 일시적 오류 응답은 _RetryTransport가 재시도
+        transport = _RetryTransport(httpx.AsyncHTTPTransport(
+            http2=find_spec("h2") is not None,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+            retries=3
+        ))
+        self._client = httpx.AsyncClient(
+            base_url=self.api_base,
+            transport=transport,
+            headers={"Authorization": self._auth_header},
+            timeout=30
+        )
+        
+        # 카테고리/태그 목록 캐시: kind -> (저장 시각, 목록), kind -> ETag
+        self._taxonomy_cache: dict[str, tuple[float, list]] = {}
+        self._taxonomy_etags: dict[str, str] = {}
+
+    async def __aenter__(self) -> "WordPressClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """공유 HTTP 클라이언트 종료"""
+        await self._client.aclose()
+
+    @staticmethod
+    def _from_api_post(result: dict) -> WordPressPost:
+        """REST API 응답을 WordPressPost로 변환 (raw 값 우선, 제외된 본문 필드는 빈 문자열)"""
+        return WordPressPost(
+            id=result["id"],
+            title=_rendered_or_raw(result.get("title")),
+            content=_rendered_or_raw(result.get("content")),
+            excerpt=_rendered_or_raw(result.get("excerpt")),
+            slug=result["slug"],
+            status=PostStatus(result["status"]),
+            date=datetime.fromisoformat(result["date"]) if result.get("date") else None,
+            categories=result.get("categories", []),
+            tags=result.get("tags", []),
+            featured_media=result.get("featured_media"),
+            meta=result.get("meta", {})
+        )
 
     async def create_post(self, post: WordPressPost) -> WordPressPost:
         """포스트 생성"""
-        data = {
-            "title": post.title,
-            "content": post.content,
-            "excerpt": post.excerpt,
-            "slug": post.slug,
-            "status": post.status.value,
-            "categories": post.categories,
-            "tags": post.tags,
-        }
+        data = _build_post_payload(post)
+
+        response = await self._client.post(
+            "/posts",
+            content=to_json(data),
+            headers=JSON_HEADERS
+        )
+        response.raise_for_status()
+        result = from_json(response.content)
         
-        if post.featured_media:
-            data["featured_media"] = post.featured_media
-            
-        if post.date:
-            data["date"] = post.date.isoformat()
-            
-        if post.meta:
-            data["meta"] = post.meta
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.api_base}/posts",
-                headers=self.headers,
-                json=data
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            return WordPressPost(
-                id=result["id"],
-                title=result["title"]["rendered"],
-                content=result["content"]["rendered"],
-                excerpt=result["excerpt"]["rendered"],
-                slug=result["slug"],
-                status=PostStatus(result["status"]),
-                date=datetime.fromisoformat(result["date"].replace("Z", "+00:00")) if result.get("date") else None,
-                categories=result.get("categories", []),
-                tags=result.get("tags", []),
-                featured_media=result.get("featured_media"),
-                meta=result.get("meta", {})
-            )
+        return self._from_api_post(result)
+
+    async def create_post_id_only(self, post: WordPressPost) -> int:
+        """포스트 생성 후 ID만 반환 (_fields=id로 응답 축소, WordPressPost 변환 생략)"""
+        response = await self._client.post(
+            "/posts",
+            params={"_fields": "id"},
+            content=to_json(_build_post_payload(post)),
+            headers=JSON_HEADERS
+        )
+        response.raise_for_status()
+        
+        return from_json(response.content)["id"]
+
+    async def create_posts_batch(self, posts: list[WordPressPost]) -> list[WordPressPost]:
+        """포스트 일괄 생성 (batch/v1, 요청당 최대 25개, 실패 시 BatchCreateError)"""
+        bodies = await self._create_posts_batched(posts, "/wp/v2/posts")
+        return [self._from_api_post(body) for body in bodies]
+
+    async def create_posts_batch_ids(self, posts: list[WordPressPost]) -> list[int]:
+        """포스트 일괄 생성 후 ID 목록만 반환"""
+        bodies = await self._create_posts_batched(posts, "/wp/v2/posts?_fields=id")
+        return [body["id"] for body in bodies]
+
+    async def _create_posts_batched(self, posts: list[WordPressPost], path: str) -> list[dict]:
+        """batch/v1로 포스트 생성 후 응답 본문 목록 반환 (청크 순차 전송, 첫 실패에서 중단)"""
+        created: list[dict] = []
+        for i in range(0, len(posts), BATCH_MAX_REQUESTS):
+            chunk = posts[i:i + BATCH_MAX_REQUESTS]
+            try:
+                created.extend(await self._create_posts_chunk(chunk, path))
+            except BatchCreateError as e:
+                raise BatchCreateError(str(e), [*created, *e.created]) from e
+            except httpx.HTTPError as e:
+                raise BatchCreateError(f"일괄 생성 요청 실패: {e}", created) from e
+        return created
+
+    async def _create_posts_chunk(self, posts: list[WordPressPost], path: str) -> list[dict]:
+        """batch/v1 단일 요청으로 포스트 생성 (일부 실패 시 생성된 항목과 함께 BatchCreateError)"""
+        response = await self._client.post(
+            f"{self.base_url}/wp-json/batch/v1",
+            content=to_json({
+                "validation": "require-all-validate",
+                "requests": [
+                    {"method": "POST", "path": path, "body": _build_post_payload(post)}
+                    for post in posts
+                ]
+            }),
+            headers=JSON_HEADERS
+        )
+        response.raise_for_status()
+        result = from_json(response.content)
+        
+        if result.get("failed"):
+            raise BatchCreateError(f"일괄 생성 요청 검증 실패: {result['failed']}", [])
+        
+        bodies = []
+        errors = []
+        for item in result["responses"]:
+            if item["status"] >= 400:
+                errors.append(f"({item['status']}) {item['body'].get('message')}")
+            else:
+                bodies.append(item["body"])
+        
+        if errors:
+            raise BatchCreateError(f"일괄 생성 실패: {'; '.join(errors)}", bodies)
+        return bodies
 
     async def update_post(self, post_id: int, post: WordPressPost) -> WordPressPost:
         """포스트 업데이트"""
-        data = {
-            "title": post.title,
-            "content": post.content,
-            "excerpt": post.excerpt,
-            "slug": post.slug,
-            "status": post.status.value,
-            "categories": post.categories,
-            "tags": post.tags,
-        }
+        data = _build_post_payload(post)
+
+        response = await self._client.post(
+            f"/posts/{post_id}",
+            content=to_json(data),
+            headers=JSON_HEADERS
+        )
+        response.raise_for_status()
+        result = from_json(response.content)
         
-        if post.featured_media:
-            data["featured_media"] = post.featured_media
-            
-        if post.date:
-            data["date"] = post.date.isoformat()
-            
-        if post.meta:
-            data["meta"] = post.meta
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.api_base}/posts/{post_id}",
-                headers=self.headers,
-                json=data
-            )
+        return self._from_api_post(result)
+
+    async def get_post(
+        self,
+        post_id: int,
+        fields: Optional[list[str]] = None,
+        context: str = "view"
+    ) -> Optional[WordPressPost]:
+        """포스트 조회 (fields 지정 시 해당 필드만 요청, context="edit"는 raw 값 포함)"""
+        params = {"context": context}
+        if fields:
+            params["_fields"] = ",".join(dict.fromkeys([*POST_REQUIRED_FIELDS, *fields]))
+        
+        try:
+            response = await self._client.get(f"/posts/{post_id}", params=params)
             response.raise_for_status()
-            result = response.json()
+            result = from_json(response.content)
             
-            return WordPressPost(
-                id=result["id"],
-                title=result["title"]["rendered"],
-                content=result["content"]["rendered"],
-                excerpt=result["excerpt"]["rendered"],
-                slug=result["slug"],
-                status=PostStatus(result["status"]),
-                date=datetime.fromisoformat(result["date"].replace("Z", "+00:00")) if result.get("date") else None,
-                categories=result.get("categories", []),
-                tags=result.get("tags", []),
-                featured_media=result.get("featured_media"),
-                meta=result.get("meta", {})
-            )
-
-    async def get_post(self, post_id: int) -> Optional[WordPressPost]:
-        """포스트 조회"""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.api_base}/posts/{post_id}",
-                    headers=self.headers
-                )
-                response.raise_for_status()
-                result = response.json()
-                
-                return WordPressPost(
-                    id=result["id"],
-                    title=result["title"]["rendered"],
-                    content=result["content"]["rendered"],
-                    excerpt=result["excerpt"]["rendered"],
-                    slug=result["slug"],
-                    status=PostStatus(result["status"]),
-                    date=datetime.fromisoformat(result["date"].replace("Z", "+00:00")) if result.get("date") else None,
-                    categories=result.get("categories", []),
-                    tags=result.get("tags", []),
-                    featured_media=result.get("featured_media"),
-                    meta=result.get("meta", {})
-                )
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                raise
+            return self._from_api_post(result)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
 
     async def delete_post(self, post_id: int) -> bool:
         """포스트 삭제"""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.delete(
-                    f"{self.api_base}/posts/{post_id}",
-                    headers=self.headers
-                )
-                response.raise_for_status()
-                return True
-            except httpx.HTTPStatusError:
-                return False
+        try:
+            response = await self._client.delete(f"/posts/{post_id}")
+            response.raise_for_status()
+            return True
+        except httpx.HTTPStatusError:
+            return False
+
+    async def delete_posts(self, post_ids: list[int]) -> list[bool]:
+        """포스트 일괄 삭제 (동시 요청, 실패한 항목은 False)"""
+        results = await asyncio.gather(
+            *(self.delete_post(post_id) for post_id in post_ids),
+            return_exceptions=True
+        )
+        return [result is True for result in results]
 
     async def upload_media(self, file_path: str, title: str, alt_text: str) -> WordPressMedia:
-        """미디어 업로드"""
-        async with aiofiles.open(file_path, 'rb') as file:
-            file_content = await file.read()
-            
-        filename = file_path.split('/')[-1]
+        """미디어 업로드 (파일 전체를 메모리에 올리지 않고 청크 단위로 전송)"""
+        filename = os.path.basename(file_path)
         
-        # multipart/form-data 헤더 (Content-Type 제거)
+        # 인증 헤더는 공유 클라이언트 기본 헤더로 전송되므로 업로드 전용 헤더만 지정
         upload_headers = {
-            "Authorization": self.headers["Authorization"],
-            "Content-Disposition": f'attachment; filename="{filename}"'
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(os.path.getsize(file_path))
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.api_base}/media",
-                headers=upload_headers,
-                content=file_content
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            # ALT 텍스트 업데이트
-            await client.post(
-                f"{self.api_base}/media/{result['id']}",
-                headers=self.headers,
-                json={"alt_text": alt_text, "title": title}
-            )
-            
-            return WordPressMedia(
-                id=result["id"],
-                title=title,
-                alt_text=alt_text,
-                source_url=result["source_url"],
-                mime_type=result["mime_type"]
-            )
+        # 제목/ALT 텍스트를 업로드 요청에 함께 전달 (후속 메타데이터 요청 생략)
+        response = await self._client.post(
+            "/media",
+            params={"title": title, "alt_text": alt_text},
+            headers=upload_headers,
+            content=_file_chunks(file_path)
+        )
+        response.raise_for_status()
+        result = from_json(response.content)
+        
+        return WordPressMedia(
+            id=result["id"],
+            title=title,
+            alt_text=alt_text,
+            source_url=result["source_url"],
+            mime_type=result["mime_type"]
+        )
 
     async def get_categories(self) -> list[Category]:
-        """카테고리 목록 조회"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.api_base}/categories",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            results = response.json()
-            
-            return [
-                Category(
-                    id=cat["id"],
-                    name=cat["name"],
-                    slug=cat["slug"]
-                )
-                for cat in results
-            ]
+        """카테고리 목록 조회 (TTL/ETag 캐시)"""
+        return await self._get_taxonomy("categories", Category)
+
+    async def get_taxonomies(self) -> tuple[list[Category], list[Tag]]:
+        """카테고리/태그 목록 동시 조회"""
+        categories, tags = await asyncio.gather(self.get_categories(), self.get_tags())
+        return categories, tags
 
     async def create_category(self, name: str, slug: str) -> Category:
         """카테고리 생성"""
         data = {
             "name": name,
-            "slug": slug or slugify(name)
+            "slug": slug or _slugify_cached(name)
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.api_base}/categories",
-                headers=self.headers,
-                json=data
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            return Category(
-                id=result["id"],
-                name=result["name"],
-                slug=result["slug"]
-            )
+        response = await self._client.post(
+            "/categories",
+            content=to_json(data),
+            headers=JSON_HEADERS
+        )
+        response.raise_for_status()
+        result = from_json(response.content)
+        
+        term = Category(
+            id=result["id"],
+            name=result["name"],
+            slug=result["slug"]
+        )
+        self._add_to_taxonomy_cache("categories", term)
+        return term
 
     async def get_tags(self) -> list[Tag]:
-        """태그 목록 조회"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.api_base}/tags",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            results = response.json()
-            
-            return [
-                Tag(
-                    id=tag["id"],
-                    name=tag["name"],
-                    slug=tag["slug"]
+        """태그 목록 조회 (TTL/ETag 캐시)"""
+        return await self._get_taxonomy("tags", Tag)
+
+    async def _get_taxonomy(self, kind: str, model: type[Category] | type[Tag]) -> list:
+        """카테고리/태그 전체 목록 조회 (TTL 내 캐시 반환, 만료 시 ETag로 재검증)"""
+        cached = self._taxonomy_cache.get(kind)
+        if cached and time.monotonic() - cached[0] < TAXONOMY_CACHE_TTL:
+            return cached[1]
+        
+        headers = {}
+        etag = self._taxonomy_etags.get(kind)
+        if cached and etag:
+            headers["If-None-Match"] = etag
+        
+        response = await self._client.get(
+            f"/{kind}",
+            params={"per_page": TAXONOMY_PAGE_SIZE, "page": 1, "_fields": TAXONOMY_FIELDS},
+            headers=headers
+        )
+        if response.status_code == 304 and cached:
+            # 변경 없음: 파싱된 목록을 그대로 재사용하고 만료 시각만 갱신
+            self._taxonomy_cache[kind] = (time.monotonic(), cached[1])
+            return cached[1]
+        
+        response.raise_for_status()
+        results = from_json(response.content)
+        
+        # 나머지 페이지는 동시 조회
+        total_pages = int(response.headers.get("X-WP-TotalPages", 1))
+        if total_pages > 1:
+            page_responses = await asyncio.gather(*(
+                self._client.get(
+                    f"/{kind}",
+                    params={
+                        "per_page": TAXONOMY_PAGE_SIZE,
+                        "page": page,
+                        "_fields": TAXONOMY_FIELDS,
+                    },
                 )
-                for tag in results
-            ]
+                for page in range(2, total_pages + 1)
+            ))
+            for page_response in page_responses:
+                page_response.raise_for_status()
+                results.extend(from_json(page_response.content))
+        
+        # 용어 수가 많을 수 있으므로 필드 추출은 itemgetter, 생성은 검증 없이 (API 응답 타입 신뢰)
+        items = [
+            model.model_construct(id=term_id, name=name, slug=slug)
+            for term_id, name, slug in map(_term_fields, results)
+        ]
+        
+        self._taxonomy_cache[kind] = (time.monotonic(), items)
+        # ETag는 첫 페이지 기준이므로 단일 페이지 목록에만 재검증 사용
+        etag = response.headers.get("etag") if total_pages == 1 else None
+        if etag:
+            self._taxonomy_etags[kind] = etag
+        else:
+            self._taxonomy_etags.pop(kind, None)
+        return items
+
+    def _add_to_taxonomy_cache(self, kind: str, term: Category | Tag) -> None:
+        """생성한 용어를 캐시 목록에 추가 (만료 시각 유지, 목록이 바뀌었으므로 ETag만 폐기)"""
+        cached = self._taxonomy_cache.get(kind)
+        if cached:
+            self._taxonomy_cache[kind] = (cached[0], [*cached[1], term])
+        self._taxonomy_etags.pop(kind, None)
+
+    def invalidate_taxonomy_cache(self, kind: Optional[str] = None) -> None:
+        """카테고리/태그 캐시 무효화 (kind 미지정 시 전체)"""
+        if kind is None:
+            self._taxonomy_cache.clear()
+            self._taxonomy_etags.clear()
+        else:
+            self._taxonomy_cache.pop(kind, None)
+            self._taxonomy_etags.pop(kind, None)
 
     async def create_tag(self, name: str, slug: str) -> Tag:
         """태그 생성"""
         data = {
             "name": name,
-            "slug": slug or slugify(name)
+            "slug": slug or _slugify_cached(name)
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.api_base}/tags",
-                headers=self.headers,
-                json=data
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            return Tag(
-                id=result["id"],
-                name=result["name"],
-                slug=result["slug"]
-            )
+        response = await self._client.post(
+            "/tags",
+            content=to_json(data),
+            headers=JSON_HEADERS
+        )
+        response.raise_for_status()
+        result = from_json(response.content)
+        
+        term = Tag(
+            id=result["id"],
+            name=result["name"],
+            slug=result["slug"]
+        )
+        self._add_to_taxonomy_cache("tags", term)
+        return term
 
 
 def create_wordpress_client() -> WordPressClient:
     """WordPress 클라이언트 팩토리 함수"""
+    settings = get_settings()
     return WordPressClient(
         base_url=settings.wordpress_url,
         username=settings.wordpress_username,
@@ -0,0 +1,7 @@
+import os
+
+# Settings 필수 값 (테스트에서는 실제 서비스에 접속하지 않음)
+os.environ.setdefault("WORDPRESS_URL", "https://wp.test")
+os.environ.setdefault("WORDPRESS_USERNAME", "tester")
+os.environ.setdefault("WORDPRESS_APP_PASSWORD", "app-password")
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
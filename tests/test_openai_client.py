@@ -0,0 +1,115 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.openai_client import OpenAIBatcher
+
+
+class FakeCompletions:
+    """지연/실패를 프롬프트로 지정하는 chat.completions 대역"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, *, messages, delay=0.0, **kwargs):
+        prompt = messages[0]["content"]
+        self.calls.append(prompt)
+        await asyncio.sleep(delay)
+        if prompt.startswith("fail"):
+            raise RuntimeError(prompt)
+        message = SimpleNamespace(content=f"answer:{prompt}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+async def make_batcher():
+    batchers = []
+
+    def factory(**kwargs) -> tuple[OpenAIBatcher, FakeCompletions]:
+        completions = FakeCompletions()
+        client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        batchers.append(OpenAIBatcher(client, **kwargs))
+        return batchers[-1], completions
+
+    yield factory
+    for batcher in batchers:
+        await batcher.aclose()
+
+
+def request(prompt: str, delay: float = 0.0) -> dict:
+    return {"messages": [{"role": "user", "content": prompt}], "delay": delay}
+
+
+async def test_results_are_matched_to_their_requests(make_batcher):
+    batcher, completions = make_batcher()
+    prompts = [f"p{i}" for i in range(5)]
+
+    results = await asyncio.gather(*(batcher.submit(**request(p)) for p in prompts))
+
+    assert results == [f"answer:{p}" for p in prompts]
+    assert sorted(completions.calls) == prompts
+
+
+async def test_exception_is_propagated_only_to_its_caller(make_batcher):
+    batcher, _ = make_batcher()
+
+    results = await asyncio.gather(
+        batcher.submit(**request("ok")),
+        batcher.submit(**request("fail-1")),
+        return_exceptions=True
+    )
+
+    assert results[0] == "answer:ok"
+    assert isinstance(results[1], RuntimeError)
+    assert str(results[1]) == "fail-1"
+
+
+async def test_cancelled_request_does_not_break_the_batch(make_batcher):
+    batcher, _ = make_batcher()
+
+    slow = asyncio.ensure_future(batcher.submit(**request("slow", delay=0.05)))
+    other = asyncio.ensure_future(batcher.submit(**request("other", delay=0.05)))
+    await asyncio.sleep(0.01)
+    slow.cancel()
+
+    assert await other == "answer:other"
+    with pytest.raises(asyncio.CancelledError):
+        await slow
+    # 워커가 계속 동작하는지 확인
+    assert await batcher.submit(**request("after")) == "answer:after"
+
+
+async def test_new_request_is_not_blocked_by_in_flight_batch(make_batcher):
+    batcher, _ = make_batcher()
+    loop = asyncio.get_running_loop()
+
+    slow = asyncio.ensure_future(batcher.submit(**request("slow", delay=1.0)))
+    await asyncio.sleep(0.05)
+    started = loop.time()
+    assert await batcher.submit(**request("fast", delay=0.05)) == "answer:fast"
+
+    assert loop.time() - started < 0.5
+    assert not slow.done()
+    await slow
+
+
+async def test_single_request_is_dispatched_without_window_delay(make_batcher):
+    batcher, _ = make_batcher(window=0.0)
+    loop = asyncio.get_running_loop()
+
+    started = loop.time()
+    await batcher.submit(**request("alone"))
+
+    assert loop.time() - started < 0.04
+
+
+async def test_worker_is_recreated_for_a_new_event_loop(make_batcher):
+    batcher, _ = make_batcher()
+
+    async def submit_once(prompt: str) -> str:
+        return await batcher.submit(**request(prompt))
+
+    # 다른 이벤트 루프에서 먼저 사용된 배처도 현재 루프에서 동작해야 함
+    assert await asyncio.to_thread(asyncio.run, submit_once("other-loop")) == "answer:other-loop"
+    assert await submit_once("this-loop") == "answer:this-loop"
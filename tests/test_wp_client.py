@@ -0,0 +1,192 @@
+import json
+
+import httpx
+import pytest
+
+from src.core.models import PostStatus, Tag, WordPressPost
+from src.wp_client import client as wp_client_module
+from src.wp_client.client import (
+    BATCH_MAX_REQUESTS,
+    BatchCreateError,
+    WordPressClient,
+    _RetryTransport,
+)
+
+
+@pytest.fixture
+async def make_client():
+    clients = []
+
+    async def factory(handler) -> tuple[WordPressClient, list[httpx.Request]]:
+        requests = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return handler(request)
+
+        wp = WordPressClient("https://wp.test", "tester", "app-password")
+        await wp.aclose()
+        # 실제 네트워크 대신 MockTransport 사용 (재시도 대기 없음)
+        wp._client = httpx.AsyncClient(
+            base_url=wp.api_base,
+            transport=_RetryTransport(httpx.MockTransport(record), backoff_factor=0),
+        )
+        clients.append(wp)
+        return wp, requests
+
+    yield factory
+    for wp in clients:
+        await wp.aclose()
+
+
+def make_post(index: int) -> WordPressPost:
+    return WordPressPost(
+        title=f"title {index}",
+        content="<p>content</p>",
+        excerpt="excerpt",
+        slug=f"post-{index}",
+        status=PostStatus.DRAFT,
+    )
+
+
+def post_body(post_id: int) -> dict:
+    return {
+        "id": post_id,
+        "slug": f"post-{post_id}",
+        "status": "draft",
+        "title": {"raw": "title"},
+        "content": {"raw": "content"},
+        "excerpt": {"raw": "excerpt"},
+    }
+
+
+class TestRetryTransport:
+    async def test_get_is_retried_on_503(self, make_client):
+        statuses = iter([503, 503, 200])
+
+        def handler(request):
+            status = next(statuses)
+            if status != 200:
+                return httpx.Response(status)
+            return httpx.Response(200, json=post_body(1))
+
+        wp, requests = await make_client(handler)
+        post = await wp.get_post(1)
+
+        assert post.id == 1
+        assert len(requests) == 3
+
+    async def test_get_gives_up_after_max_retries(self, make_client):
+        wp, requests = await make_client(lambda request: httpx.Response(503))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await wp.get_post(1)
+        assert len(requests) == 4  # 최초 요청 + 재시도 3회
+
+    async def test_post_is_not_retried(self, make_client):
+        wp, requests = await make_client(lambda request: httpx.Response(503))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await wp.create_post(make_post(1))
+        assert len(requests) == 1
+
+
+class TestCreatePostsBatch:
+    async def test_created_ids_after_failed_second_chunk(self, make_client):
+        next_id = iter(range(1, 100))
+
+        def handler(request):
+            payload = json.loads(request.content)
+            if len(requests) == 1:
+                responses = [
+                    {"status": 201, "body": post_body(next(next_id))}
+                    for _ in payload["requests"]
+                ]
+            else:
+                # 두 번째 청크: 첫 항목만 생성되고 두 번째 항목 실패
+                responses = [
+                    {"status": 201, "body": post_body(next(next_id))},
+                    {"status": 400, "body": {"message": "invalid slug"}},
+                ]
+            return httpx.Response(207, json={"responses": responses})
+
+        wp, requests = await make_client(handler)
+        posts = [make_post(i) for i in range(BATCH_MAX_REQUESTS + 2)]
+
+        with pytest.raises(BatchCreateError) as exc_info:
+            await wp.create_posts_batch(posts)
+
+        assert len(requests) == 2
+        assert exc_info.value.created_ids == list(range(1, BATCH_MAX_REQUESTS + 2))
+        assert "invalid slug" in str(exc_info.value)
+
+    async def test_created_ids_after_second_chunk_request_error(self, make_client):
+        def handler(request):
+            if len(requests) == 1:
+                payload = json.loads(request.content)
+                responses = [
+                    {"status": 201, "body": post_body(i)}
+                    for i in range(1, len(payload["requests"]) + 1)
+                ]
+                return httpx.Response(207, json={"responses": responses})
+            return httpx.Response(500)
+
+        wp, requests = await make_client(handler)
+        posts = [make_post(i) for i in range(BATCH_MAX_REQUESTS + 1)]
+
+        with pytest.raises(BatchCreateError) as exc_info:
+            await wp.create_posts_batch_ids(posts)
+
+        assert exc_info.value.created_ids == list(range(1, BATCH_MAX_REQUESTS + 1))
+
+
+class TestTaxonomyCache:
+    async def test_all_pages_are_fetched(self, make_client):
+        def handler(request):
+            page = int(request.url.params["page"])
+            terms = [{"id": page, "name": f"tag {page}", "slug": f"tag-{page}"}]
+            return httpx.Response(200, json=terms, headers={"X-WP-TotalPages": "3"})
+
+        wp, requests = await make_client(handler)
+        tags = await wp.get_tags()
+
+        assert [tag.id for tag in tags] == [1, 2, 3]
+        assert sorted(int(r.url.params["page"]) for r in requests) == [1, 2, 3]
+        # TTL 내에는 캐시 사용
+        assert await wp.get_tags() == tags
+        assert len(requests) == 3
+
+    async def test_not_modified_reuses_cached_list(self, make_client, monkeypatch):
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            terms = [{"id": 1, "name": "tag", "slug": "tag"}]
+            return httpx.Response(
+                200, json=terms, headers={"X-WP-TotalPages": "1", "ETag": '"v1"'}
+            )
+
+        wp, requests = await make_client(handler)
+        tags = await wp.get_tags()
+
+        # TTL 만료 후 ETag로 재검증
+        monkeypatch.setattr(wp_client_module, "TAXONOMY_CACHE_TTL", 0)
+        assert await wp.get_tags() is tags
+        assert len(requests) == 2
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    async def test_created_tag_is_added_to_cache(self, make_client):
+        def handler(request):
+            if request.method == "POST":
+                return httpx.Response(201, json={"id": 2, "name": "new", "slug": "new"})
+            terms = [{"id": 1, "name": "tag", "slug": "tag"}]
+            return httpx.Response(200, json=terms, headers={"X-WP-TotalPages": "1"})
+
+        wp, requests = await make_client(handler)
+        await wp.get_tags()
+        await wp.create_tag("new", "")
+
+        assert await wp.get_tags() == [
+            Tag(id=1, name="tag", slug="tag"),
+            Tag(id=2, name="new", slug="new"),
+        ]
+        assert [r.method for r in requests] == ["GET", "POST"]